@@ -5,6 +5,7 @@ Create a .env file based on .env.template and populate with your credentials.
 """
 
 import os
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Tuple
 
 # Placeholder values for API keys
@@ -126,13 +127,13 @@ def adjust_caption_for_platform(caption: str, platform: str) -> str:
     
     # Handle Instagram-specific adjustments
     if platform.lower() == 'instagram':
-        # Count and limit hashtags
-        hashtags = [word for word in caption.split() if word.startswith('#')]
+        # Count and limit hashtags (split once, reused for filtering)
+        caption_parts = caption.split()
+        hashtags = [word for word in caption_parts if word.startswith('#')]
         max_hashtags = requirements.get('max_hashtags', 30)
         
         if len(hashtags) > max_hashtags:
             # Keep only the first max_hashtags hashtags
-            caption_parts = caption.split()
             hashtag_count = 0
             filtered_parts = []
             
@@ -169,18 +170,14 @@ def adjust_image_for_platform(image_path: str, platform: str) -> Optional[str]:
     Returns:
         Path to adjusted image, or None if failed
     """
-    try:
-        from utils.image_utils import ImageUtils
-    except ImportError as e:
-        print(f"Warning: Could not import ImageUtils: {e}")
-        return image_path
-    
     requirements = PLATFORM_REQUIREMENTS.get(platform.lower(), {})
     max_size = requirements.get('max_image_size')
     
     if not max_size:
         return image_path  # No adjustment needed
     
+    from utils.image_utils import ImageUtils
+    
     # Resize image to meet platform requirements
     try:
         adjusted_path = ImageUtils.resize_image(
@@ -280,88 +277,95 @@ def unified_post_workflow(
             instagram_service=instagram_service,
             max_workers=APP_SETTINGS['concurrent_uploads']
         )
+        # Close the pool and connections we created once the workflow ends
+        manager_context = share_manager
+    else:
+        # Caller owns the manager and its lifecycle
+        manager_context = nullcontext(share_manager)
     
-    results = {}
-    max_attempts = UNIFIED_WORKFLOW_CONFIG['max_retry_attempts']
-    retry_delay = UNIFIED_WORKFLOW_CONFIG['retry_delay']
-    
-    # Process each platform
-    for platform in platforms:
-        platform_lower = platform.lower()
-        error_log = []
-        
-        if logger:
-            logger.info(f"Starting upload to {platform}")
-        
-        # Adjust caption for platform
-        adjusted_caption = adjust_caption_for_platform(caption, platform_lower)
+    with manager_context:
+        results = {}
+        max_attempts = UNIFIED_WORKFLOW_CONFIG['max_retry_attempts']
+        retry_delay = UNIFIED_WORKFLOW_CONFIG['retry_delay']
         
-        if logger and adjusted_caption != caption:
-            logger.info(f"Caption adjusted for {platform}: length {len(caption)} -> {len(adjusted_caption)}")
-        
-        # Adjust image for platform
-        adjusted_image = adjust_image_for_platform(image_path, platform_lower)
-        
-        if logger and adjusted_image != image_path:
-            logger.info(f"Image adjusted for {platform}: {image_path} -> {adjusted_image}")
-        
-        # Retry logic
-        success = False
-        message = ""
-        
-        for attempt in range(1, max_attempts + 1):
-            try:
-                if logger:
-                    logger.info(f"Attempt {attempt}/{max_attempts} for {platform}")
-                
-                # Share to platform
-                platform_name, success, message = share_manager.share_to_platform(
-                    platform_lower,
-                    adjusted_image,
-                    adjusted_caption
-                )
-                
-                if success:
+        # Process each platform
+        for platform in platforms:
+            platform_lower = platform.lower()
+            error_log = []
+            
+            if logger:
+                logger.info(f"Starting upload to {platform}")
+            
+            # Adjusted caption for platform
+            adjusted_caption = adjust_caption_for_platform(caption, platform_lower)
+            
+            if logger and adjusted_caption != caption:
+                logger.info(f"Caption adjusted for {platform}: length {len(caption)} -> {len(adjusted_caption)}")
+            
+            # Adjust image for platform (not precomputed: every resize writes the
+            # same *_resized file, so it must happen right before this upload)
+            adjusted_image = adjust_image_for_platform(image_path, platform_lower)
+            
+            if logger and adjusted_image != image_path:
+                logger.info(f"Image adjusted for {platform}: {image_path} -> {adjusted_image}")
+            
+            # Retry logic
+            success = False
+            message = ""
+            
+            for attempt in range(1, max_attempts + 1):
+                try:
                     if logger:
-                        logger.info(f"Successfully posted to {platform}: {message}")
-                    break
-                else:
-                    error_msg = f"Attempt {attempt} failed: {message}"
+                        logger.info(f"Attempt {attempt}/{max_attempts} for {platform}")
+                    
+                    # Share to platform
+                    platform_name, success, message = share_manager.share_to_platform(
+                        platform_lower,
+                        adjusted_image,
+                        adjusted_caption
+                    )
+                    
+                    if success:
+                        if logger:
+                            logger.info(f"Successfully posted to {platform}: {message}")
+                        break
+                    else:
+                        error_msg = f"Attempt {attempt} failed: {message}"
+                        error_log.append(error_msg)
+                        
+                        if logger:
+                            logger.warning(f"{platform} - {error_msg}")
+                        
+                        if attempt < max_attempts:
+                            if logger:
+                                logger.info(f"Retrying {platform} in {retry_delay} seconds...")
+                            time.sleep(retry_delay)
+                
+                except Exception as e:
+                    error_msg = f"Attempt {attempt} exception: {str(e)}"
                     error_log.append(error_msg)
                     
                     if logger:
-                        logger.warning(f"{platform} - {error_msg}")
+                        logger.error(f"{platform} - {error_msg}", exc_info=True)
                     
                     if attempt < max_attempts:
                         if logger:
                             logger.info(f"Retrying {platform} in {retry_delay} seconds...")
                         time.sleep(retry_delay)
+                    else:
+                        message = f"All {max_attempts} attempts failed. Last error: {str(e)}"
             
-            except Exception as e:
-                error_msg = f"Attempt {attempt} exception: {str(e)}"
-                error_log.append(error_msg)
-                
-                if logger:
-                    logger.error(f"{platform} - {error_msg}", exc_info=True)
-                
-                if attempt < max_attempts:
-                    if logger:
-                        logger.info(f"Retrying {platform} in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+            # Store results
+            results[platform] = (success, message, error_log)
+            
+            if logger:
+                if success:
+                    logger.info(f"Final result for {platform}: SUCCESS")
                 else:
-                    message = f"All {max_attempts} attempts failed. Last error: {str(e)}"
+                    logger.error(f"Final result for {platform}: FAILED after {max_attempts} attempts")
+                    logger.error(f"Error summary: {'; '.join(error_log)}")
         
-        # Store results
-        results[platform] = (success, message, error_log)
-        
-        if logger:
-            if success:
-                logger.info(f"Final result for {platform}: SUCCESS")
-            else:
-                logger.error(f"Final result for {platform}: FAILED after {max_attempts} attempts")
-                logger.error(f"Error summary: {'; '.join(error_log)}")
-    
-    return results
+        return results
 
 
 def get_unified_workflow_summary(results: Dict[str, Tuple[bool, str, List[str]]]) -> str:
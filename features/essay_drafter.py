@@ -5,14 +5,66 @@ Extracts text from screenshots and drafts essays based on authorial voice files.
 
 import os
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 from PIL import Image
 import pytesseract
 from anthropic import Anthropic
 
+# tesserocr is optional; it keeps Tesseract loaded in-process instead of
+# spawning the tesseract binary for every image like pytesseract does
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Formats the tesseract binary reads itself, so pytesseract can be handed the path
+TESSERACT_NATIVE_EXTENSIONS = frozenset(('.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp'))
+
+# LSTM engine only, treating the image as a single uniform block of text
+TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+NO_TEXT_ERROR = "No text could be extracted from the image. Please ensure the image contains readable text."
+
+
+def pytesseract_text(image_path: str) -> str:
+    """
+    Run pytesseract on an image file with the shared OCR settings.
+
+    Args:
+        image_path: Path to the image
+
+    Returns:
+        Raw extracted text
+    """
+    if os.path.splitext(image_path)[1].lower() in TESSERACT_NATIVE_EXTENSIONS:
+        # Skip decoding and re-encoding to a temp file in Python
+        return pytesseract.image_to_string(image_path, config=TESSERACT_CONFIG)
+
+    # Single-band grayscale keeps the temp image pytesseract writes small
+    with Image.open(image_path) as image:
+        return pytesseract.image_to_string(image.convert('L'), config=TESSERACT_CONFIG)
+
+
+def ocr_result(text: str, min_text_length: int) -> Tuple[bool, str]:
+    """
+    Turn raw OCR output into a (success, text or error_message) result.
+
+    Args:
+        text: Raw extracted text
+        min_text_length: Minimum stripped length to count as success
+
+    Returns:
+        Tuple of (success, extracted_text or error_message)
+    """
+    if not text or len(text.strip()) < min_text_length:
+        return False, NO_TEXT_ERROR
+    return True, text.strip()
+
 
 class EssayDrafter:
     """Manages essay drafting from screenshots using OCR and AI."""
@@ -36,6 +88,10 @@ class EssayDrafter:
         self.model = model
         self.authorial_styles_dir = authorial_styles_dir
         self.min_text_length = min_text_length
+
+        # In-process Tesseract handle, created on first OCR call
+        self._api = None
+        self._api_lock = threading.Lock()
         
         # Import config to use the constant
         import config
@@ -122,18 +178,31 @@ class EssayDrafter:
             if not os.path.exists(image_path):
                 return False, f"Image file not found: {image_path}"
 
-            # Open image and perform OCR
-            with Image.open(image_path) as image:
-                text = pytesseract.image_to_string(image)
-
-            if not text or len(text.strip()) < self.min_text_length:
-                return False, "No text could be extracted from the image. Please ensure the image contains readable text."
+            # Perform OCR, reusing the loaded Tesseract model when available
+            if HAS_TESSEROCR:
+                text = self._tesserocr_text(image_path)
+            else:
+                text = pytesseract_text(image_path)
 
-            return True, text.strip()
+            return ocr_result(text, self.min_text_length)
 
         except Exception as e:
             return False, f"Error extracting text: {str(e)}"
 
+    def _tesserocr_text(self, image_path: str) -> str:
+        """Run OCR through a shared tesserocr API, creating it on first use."""
+        with self._api_lock:
+            if self._api is None:
+                self._api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+            self._api.SetImageFile(image_path)
+            return self._api.GetUTF8Text()
+
+    def __del__(self):
+        """Release the tesserocr API if one was created."""
+        api = getattr(self, '_api', None)
+        if api is not None:
+            api.End()
+
     def summarize_and_extract_arguments(self, text: str) -> Tuple[bool, str]:
         """
         Summarize extracted text and identify key arguments.
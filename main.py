@@ -16,7 +16,6 @@ from kivymd.uix.dialog import MDDialog
 from kivymd.uix.button import MDFlatButton, MDRaisedButton
 from kivymd.uix.list import OneLineListItem, MDList
 from kivymd.uix.menu import MDDropdownMenu
-from kivymd.uix.textfield import MDTextField
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.label import MDLabel
 from kivymd.uix.card import MDCard
@@ -184,6 +183,7 @@ class PostboiApp(MDApp):
                 )
 
             # Initialize ShareManager
+            old_share_manager = self.share_manager
             self.share_manager = ShareManager(
                 wordpress_service=wordpress_service,
                 facebook_service=facebook_service,
@@ -191,6 +191,11 @@ class PostboiApp(MDApp):
                 max_workers=config.APP_SETTINGS['concurrent_uploads']
             )
 
+            # Release the previous manager's pool and connections; close()
+            # waits for in-flight uploads, so keep it off the UI thread
+            if old_share_manager is not None:
+                threading.Thread(target=old_share_manager.close, daemon=True).start()
+
             # Initialize Scheduler
             self.scheduler = Scheduler(
                 share_callback=self._scheduler_share_callback
@@ -887,28 +892,34 @@ class PostboiApp(MDApp):
             daemon=True
         ).start()
 
+    def _on_main(self, fn, *args):
+        """Schedule fn(*args) to run once on the main thread."""
+        Clock.schedule_once(lambda dt: fn(*args), 0)
+
     def _draft_essay_from_screenshot(self, image_path: str, voice_index: int):
         """Draft essay from screenshot in background thread."""
+        state = {'result': None, 'error': None}
         try:
             # Process screenshot to essay
-            result = self.essay_drafter.process_screenshot_to_essay(
+            state['result'] = self.essay_drafter.process_screenshot_to_essay(
                 image_path,
                 voice_index
             )
+        except Exception as e:
+            state['error'] = e
 
-            # Show results on main thread
-            Clock.schedule_once(
-                lambda dt: self._on_essay_draft_complete(result),
-                0
-            )
+        # Hand the final state to the main thread in a single scheduled event
+        self._on_main(self._finish_draft, state)
 
-        except Exception as e:
-            Clock.schedule_once(
-                lambda dt: self.show_error_dialog(f"Error drafting essay: {str(e)}"),
-                0
-            )
-        finally:
-            Clock.schedule_once(lambda dt: setattr(self, 'is_loading', False), 0)
+    def _finish_draft(self, state: Dict):
+        """Apply the outcome of a background essay draft on the main thread."""
+        self.is_loading = False
+
+        if state['error'] is not None:
+            self.show_error_dialog(f"Error drafting essay: {str(state['error'])}")
+            return
+
+        self._on_essay_draft_complete(state['result'])
 
     def _on_essay_draft_complete(self, result: Dict):
         """Handle essay draft completion on main thread."""
@@ -926,17 +937,19 @@ class PostboiApp(MDApp):
 
     def _show_essay_dialog(self, essay: str, result: Dict):
         """Show dialog with drafted essay."""
-        # Create a scrollable text field with the essay
-        text_field = MDTextField(
-            text=essay,
-            multiline=True,
-            readonly=True,
-            size_hint_y=None,
-            height="400dp"
+        # Render one wrapped read-only label per paragraph; a single
+        # multiline MDTextField lays out very slowly for long essays
+        paragraphs = MDBoxLayout(
+            orientation='vertical',
+            adaptive_height=True,
+            spacing="12dp"
         )
+        for paragraph in essay.split("\n\n"):
+            if paragraph.strip():
+                paragraphs.add_widget(MDLabel(text=paragraph, adaptive_height=True))
 
-        scroll = ScrollView(size_hint=(1, 1))
-        scroll.add_widget(text_field)
+        scroll = ScrollView(size_hint=(1, None), height="400dp")
+        scroll.add_widget(paragraphs)
 
         if self.dialog:
             self.dialog.dismiss()
@@ -971,6 +984,8 @@ class PostboiApp(MDApp):
         """Called when the app is closing."""
         if self.scheduler:
             self.scheduler.shutdown()
+        if self.share_manager:
+            self.share_manager.close()
 
 
 def main():
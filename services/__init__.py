@@ -1,8 +1,8 @@
 """Services package for Postboi."""
 
-from services.wordpress import WordPressService
+from services.wordpress import WordPressService, AsyncWordPressService
 from services.facebook_share import FacebookService
-from services.instagram_share import InstagramService
+from services.instagram_share import InstagramService, AsyncInstagramService
 from services.share_manager import ShareManager
 from services.auth_service import AuthService, AuthResult, User
 from services.monetization_service import (
@@ -18,8 +18,10 @@ from services.monetization_service import (
 
 __all__ = [
     'WordPressService',
+    'AsyncWordPressService',
     'FacebookService',
     'InstagramService',
+    'AsyncInstagramService',
     'ShareManager',
     'AuthService',
     'AuthResult',
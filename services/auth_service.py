@@ -6,7 +6,7 @@ Adapted from the Create app's auth module for Python/Kivy.
 
 Features:
 - Local user registration and authentication
-- Secure password hashing with bcrypt
+- Secure password hashing with argon2id (bcrypt/SHA-256 fallbacks)
 - Persistent session management
 - User profile management
 - Integration with social media credentials
@@ -22,13 +22,28 @@ from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-# Try to import bcrypt, fall back to hashlib if not available
+# Prefer argon2id, then bcrypt, then fall back to hashlib
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    HAS_ARGON2 = True
+except ImportError:
+    HAS_ARGON2 = False
+
 try:
     import bcrypt
     HAS_BCRYPT = True
 except ImportError:
     HAS_BCRYPT = False
-    print("[Auth] bcrypt not available, using SHA-256 (less secure)")
+
+if not HAS_ARGON2 and not HAS_BCRYPT:
+    print("[Auth] argon2/bcrypt not available, using SHA-256 (less secure)")
+
+# argon2id tuned for interactive logins: 64 MB, 2 passes, 1 lane
+_ARGON2_HASHER = (
+    PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+    if HAS_ARGON2 else None
+)
 
 
 class AuthResult(Enum):
@@ -112,6 +127,10 @@ class AuthService:
         self._users_file = self._data_dir / "users.json"
         self._sessions_file = self._data_dir / "sessions.json"
         
+        # In-memory copies of users.json / sessions.json (write-through)
+        self._users_cache: Optional[Dict[str, Dict]] = None
+        self._sessions_cache: Optional[Dict[str, Dict]] = None
+        
         # Current session state
         self._current_user: Optional[User] = None
         self._current_session: Optional[Session] = None
@@ -136,49 +155,91 @@ class AuthService:
         
         return base / self.app_name / "auth"
     
-    def _load_users(self) -> Dict[str, Dict]:
-        """Load users from storage"""
-        if self._users_file.exists():
+    def _read_json(self, path: Path) -> Dict[str, Dict]:
+        """Read a JSON store from disk, returning an empty dict on failure"""
+        if path.exists():
             try:
-                with open(self._users_file, 'r') as f:
+                with open(path, 'r') as f:
                     return json.load(f)
             except (json.JSONDecodeError, IOError):
                 return {}
         return {}
     
+    def _load_users(self) -> Dict[str, Dict]:
+        """Load users from storage (cached for the process lifetime)"""
+        if self._users_cache is None:
+            self._users_cache = self._read_json(self._users_file)
+        return self._users_cache
+    
+    def _write_json(self, path: Path, data: Dict[str, Dict]) -> None:
+        """Write a JSON store atomically via a temp file and rename"""
+        tmp_path = path.with_suffix('.json.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+    
     def _save_users(self, users: Dict[str, Dict]) -> None:
         """Save users to storage"""
-        with open(self._users_file, 'w') as f:
-            json.dump(users, f, indent=2)
+        try:
+            self._write_json(self._users_file, users)
+        except BaseException:
+            # Callers edit the cached dict in place; drop it so the
+            # unsaved change is reloaded from disk rather than kept
+            self._users_cache = None
+            raise
+        self._users_cache = users
     
     def _load_sessions(self) -> Dict[str, Dict]:
-        """Load sessions from storage"""
-        if self._sessions_file.exists():
-            try:
-                with open(self._sessions_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
+        """Load sessions from storage (cached for the process lifetime)"""
+        if self._sessions_cache is None:
+            self._sessions_cache = self._read_json(self._sessions_file)
+        return self._sessions_cache
     
     def _save_sessions(self, sessions: Dict[str, Dict]) -> None:
         """Save sessions to storage"""
-        with open(self._sessions_file, 'w') as f:
-            json.dump(sessions, f, indent=2)
+        try:
+            self._write_json(self._sessions_file, sessions)
+        except BaseException:
+            # Same as _save_users: never keep an unsaved in-place edit
+            self._sessions_cache = None
+            raise
+        self._sessions_cache = sessions
     
     def _hash_password(self, password: str) -> str:
-        """Hash password using bcrypt or SHA-256 fallback"""
-        if HAS_BCRYPT:
+        """Hash password using argon2id, bcrypt, or SHA-256 fallback"""
+        if HAS_ARGON2:
+            return _ARGON2_HASHER.hash(password)
+        elif HAS_BCRYPT:
             return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
         else:
-            # Fallback: SHA-256 with salt (less secure than bcrypt)
+            # Fallback: SHA-256 with salt (less secure than argon2/bcrypt)
             salt = secrets.token_hex(16)
-            hash_val = hashlib.sha256(f"{salt}{password}".encode()).hexdigest()
-            return f"{salt}${hash_val}"
+            return f"{salt}${self._sha256_digest(salt, password)}"
+    
+    @staticmethod
+    def _sha256_digest(salt: str, password: str) -> str:
+        """Salted SHA-256 digest, fed incrementally to avoid building salt+password"""
+        h = hashlib.sha256(salt.encode())
+        h.update(password.encode())
+        return h.hexdigest()
     
     def _verify_password(self, password: str, hashed: str) -> bool:
-        """Verify password against hash"""
-        if HAS_BCRYPT:
+        """Verify password against hash, dispatching on the hash prefix"""
+        if hashed.startswith("$argon2"):
+            if not HAS_ARGON2:
+                return False
+            try:
+                return _ARGON2_HASHER.verify(hashed, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        elif hashed.startswith("$2"):
+            if not HAS_BCRYPT:
+                return False
             try:
                 return bcrypt.checkpw(password.encode(), hashed.encode())
             except (ValueError, TypeError):
@@ -187,11 +248,22 @@ class AuthService:
             # Fallback verification
             try:
                 salt, hash_val = hashed.split('$')
-                check_hash = hashlib.sha256(f"{salt}{password}".encode()).hexdigest()
-                return check_hash == hash_val
+                check_hash = self._sha256_digest(salt, password)
+                return secrets.compare_digest(check_hash, hash_val)
             except (ValueError, TypeError):
                 return False
     
+    def _needs_rehash(self, hashed: str) -> bool:
+        """Check if a stored hash should be upgraded to current argon2 parameters"""
+        if not HAS_ARGON2:
+            return False
+        if not hashed.startswith("$argon2"):
+            return True
+        try:
+            return _ARGON2_HASHER.check_needs_rehash(hashed)
+        except InvalidHashError:
+            return True
+    
     def _generate_user_id(self) -> str:
         """Generate unique user ID"""
         return secrets.token_hex(16)
@@ -380,6 +452,12 @@ class AuthService:
         if not self._verify_password(password, user_record['password_hash']):
             return AuthResult.INVALID_CREDENTIALS, None
         
+        # Opportunistically migrate legacy bcrypt/SHA-256 hashes to argon2id
+        if self._needs_rehash(user_record['password_hash']):
+            user_record['password_hash'] = self._hash_password(password)
+            users[email] = user_record
+            self._save_users(users)
+        
         # Create session
         user = User.from_dict(user_record['user'])
         self._current_session = self._create_session(user.id)
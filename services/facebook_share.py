@@ -44,21 +44,27 @@ class FacebookService:
         except requests.exceptions.RequestException as e:
             return False, f"Connection error: {str(e)}"
 
-    def upload_photo(self, image_path: str, caption: str) -> Tuple[bool, str]:
+    def upload_photo(self, image_path: str, caption: str,
+                     image_bytes: Optional[bytes] = None) -> Tuple[bool, str]:
         """
         Upload photo to Facebook page.
 
         Args:
             image_path: Path to the image file
             caption: Photo caption/description
+            image_bytes: Already-read file contents (optional); skips reading
+                image_path when another platform has loaded it
 
         Returns:
             Tuple of (success, message/post_id)
         """
         try:
-            # Read image file
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
+            # Read image file unless the caller already has its contents
+            if image_bytes is not None:
+                image_data = image_bytes
+            else:
+                with open(image_path, 'rb') as f:
+                    image_data = f.read()
 
             # Prepare the request
             url = f"{self.graph_api_base}/{self.page_id}/photos"
@@ -114,15 +120,17 @@ class FacebookService:
         except Exception as e:
             return False, f"Error creating post: {str(e)}"
 
-    def share(self, image_path: str, caption: str) -> Tuple[bool, str]:
+    def share(self, image_path: str, caption: str,
+              image_bytes: Optional[bytes] = None) -> Tuple[bool, str]:
         """
         Share image and caption to Facebook (high-level method).
 
         Args:
             image_path: Path to the image file
             caption: Post caption/description
+            image_bytes: Already-read file contents (optional)
 
         Returns:
             Tuple of (success, message/url)
         """
-        return self.upload_photo(image_path, caption)
+        return self.upload_photo(image_path, caption, image_bytes)
@@ -4,14 +4,45 @@ Handles posting images to Instagram Business/Creator accounts.
 Includes fallback to native share intent for personal accounts.
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
+# aiohttp is optional; only AsyncInstagramService needs it
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+
+class _GraphRetry(Retry):
+    """
+    Retry policy for Graph API calls.
+
+    GETs are retried on any status in status_forcelist. POSTs (container
+    creation, publishing) are retried only on 429: a 5xx from a gateway may
+    come after the request was processed, and replaying it could publish
+    the post twice.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == 'POST':
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
 
 class InstagramService:
     """Service for interacting with Instagram Graph API."""
 
+    # Backoff schedule (seconds) for polling a media container's status;
+    # the last delay repeats until CONTAINER_READY_TIMEOUT is reached
+    CONTAINER_POLL_DELAYS = (0.25, 0.5, 1, 1, 2, 2)
+    CONTAINER_READY_TIMEOUT = 15.0
+
     def __init__(self, business_account_id: str, access_token: str):
         """
         Initialize Instagram service.
@@ -24,6 +55,35 @@ class InstagramService:
         self.access_token = access_token
         self.graph_api_base = "https://graph.facebook.com/v18.0"
 
+        # Pooled keep-alive session so test -> create -> publish reuse one
+        # TLS connection; the access token rides along as a default param.
+        # Transient 5xx/429 responses are retried by urllib3 with backoff
+        # over the same pooled connection (POSTs only on 429, see _GraphRetry).
+        retry = _GraphRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        )
+        self._session.params = {'access_token': self.access_token}
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test connection to Instagram Graph API.
@@ -32,9 +92,9 @@ class InstagramService:
             Tuple of (success, message)
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.graph_api_base}/{self.business_account_id}",
-                params={'access_token': self.access_token, 'fields': 'username'},
+                params={'fields': 'username'},
                 timeout=10
             )
             if response.status_code == 200:
@@ -60,12 +120,11 @@ class InstagramService:
         try:
             url = f"{self.graph_api_base}/{self.business_account_id}/media"
             params = {
-                'access_token': self.access_token,
                 'image_url': image_url,
                 'caption': caption,
             }
 
-            response = requests.post(url, params=params, timeout=30)
+            response = self._session.post(url, params=params, timeout=30)
 
             if response.status_code == 200:
                 container_id = response.json().get('id')
@@ -79,6 +138,41 @@ class InstagramService:
             print(f"Error creating media container: {str(e)}")
             return None
 
+    def wait_for_container(self, container_id: str) -> Tuple[bool, str]:
+        """
+        Poll a media container until Instagram has finished processing it.
+
+        Args:
+            container_id: Media container ID from create_media_container
+
+        Returns:
+            Tuple of (ready, status_code or error message)
+        """
+        deadline = time.monotonic() + self.CONTAINER_READY_TIMEOUT
+        attempt = 0
+
+        while True:
+            try:
+                response = self._session.get(
+                    f"{self.graph_api_base}/{container_id}",
+                    params={'fields': 'status_code'},
+                    timeout=10
+                )
+                if response.status_code == 200:
+                    status = response.json().get('status_code', '')
+                    if status == 'FINISHED':
+                        return True, status
+                    if status in ('ERROR', 'EXPIRED'):
+                        return False, f"Media container {status.lower()}"
+            except requests.exceptions.RequestException as e:
+                print(f"Error polling media container: {str(e)}")
+
+            delay = self.CONTAINER_POLL_DELAYS[min(attempt, len(self.CONTAINER_POLL_DELAYS) - 1)]
+            if time.monotonic() + delay > deadline:
+                return False, "Timed out waiting for media container"
+            time.sleep(delay)
+            attempt += 1
+
     def publish_media(self, container_id: str) -> Tuple[bool, str]:
         """
         Publish a media container to Instagram.
@@ -92,11 +186,10 @@ class InstagramService:
         try:
             url = f"{self.graph_api_base}/{self.business_account_id}/media_publish"
             params = {
-                'access_token': self.access_token,
                 'creation_id': container_id,
             }
 
-            response = requests.post(url, params=params, timeout=30)
+            response = self._session.post(url, params=params, timeout=30)
 
             if response.status_code == 200:
                 post_id = response.json().get('id', '')
@@ -124,8 +217,10 @@ class InstagramService:
         if not container_id:
             return False, "Failed to create media container"
 
-        # Wait a moment for processing
-        time.sleep(2)
+        # Wait until the container has finished processing
+        ready, status = self.wait_for_container(container_id)
+        if not ready:
+            return False, status
 
         # Publish media
         success, result = self.publish_media(container_id)
@@ -172,3 +267,218 @@ class InstagramService:
             'caption': caption,
             'message': 'Copy the caption above, then select Instagram to share!'
         }
+
+
+class AsyncInstagramService:
+    """
+    asyncio counterpart of InstagramService for sharing many posts concurrently.
+
+    All requests go through one aiohttp.ClientSession whose connector pools
+    sockets and caches DNS, so N shares cost roughly one round-trip each
+    instead of N serial create/poll/publish sequences.
+
+    Usage:
+        async with AsyncInstagramService(account_id, token) as ig:
+            results = await asyncio.gather(
+                *(ig.share(url, caption) for url, caption in jobs)
+            )
+    """
+
+    CONTAINER_POLL_DELAYS = InstagramService.CONTAINER_POLL_DELAYS
+    CONTAINER_READY_TIMEOUT = InstagramService.CONTAINER_READY_TIMEOUT
+
+    def __init__(self, business_account_id: str, access_token: str):
+        """
+        Initialize async Instagram service.
+
+        Args:
+            business_account_id: Instagram Business Account ID
+            access_token: Facebook access token with Instagram permissions
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for AsyncInstagramService")
+
+        self.business_account_id = business_account_id
+        self.access_token = access_token
+        self.graph_api_base = "https://graph.facebook.com/v18.0"
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Create the shared session lazily, inside the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _request(self, method: str, url: str, params: Dict[str, str],
+                       timeout: float) -> Tuple[int, Dict[str, Any]]:
+        """Issue a Graph API request and return (status, decoded JSON body)."""
+        params = {**params, 'access_token': self.access_token}
+        async with self._get_session().request(
+            method, url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            # Gateway/proxy error pages are HTML; only decode JSON bodies
+            data = await response.json() if 'json' in response.content_type else None
+            return response.status, data if isinstance(data, dict) else {}
+
+    async def test_connection(self) -> Tuple[bool, str]:
+        """
+        Test connection to Instagram Graph API.
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            status, data = await self._request(
+                'GET',
+                f"{self.graph_api_base}/{self.business_account_id}",
+                {'fields': 'username'},
+                timeout=10
+            )
+            if status == 200:
+                return True, f"Connected to Instagram: @{data.get('username', 'Unknown')}"
+            error = data.get('error', {})
+            return False, f"Authentication failed: {error.get('message', 'Unknown error')}"
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return False, f"Connection error: {str(e)}"
+
+    async def create_media_container(self, image_url: str, caption: str) -> Optional[str]:
+        """
+        Create a media container for Instagram post.
+
+        Args:
+            image_url: Public URL of the image to post
+            caption: Post caption
+
+        Returns:
+            Container ID if successful, None otherwise
+        """
+        try:
+            status, data = await self._request(
+                'POST',
+                f"{self.graph_api_base}/{self.business_account_id}/media",
+                {'image_url': image_url, 'caption': caption},
+                timeout=30
+            )
+            if status == 200:
+                return data.get('id')
+            error = data.get('error', {})
+            print(f"Failed to create container: {error.get('message', 'Unknown error')}")
+            return None
+        except Exception as e:
+            print(f"Error creating media container: {str(e)}")
+            return None
+
+    async def wait_for_container(self, container_id: str) -> Tuple[bool, str]:
+        """
+        Poll a media container until Instagram has finished processing it.
+
+        Args:
+            container_id: Media container ID from create_media_container
+
+        Returns:
+            Tuple of (ready, status_code or error message)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.CONTAINER_READY_TIMEOUT
+        attempt = 0
+
+        while True:
+            try:
+                status, data = await self._request(
+                    'GET',
+                    f"{self.graph_api_base}/{container_id}",
+                    {'fields': 'status_code'},
+                    timeout=10
+                )
+                if status == 200:
+                    status_code = data.get('status_code', '')
+                    if status_code == 'FINISHED':
+                        return True, status_code
+                    if status_code in ('ERROR', 'EXPIRED'):
+                        return False, f"Media container {status_code.lower()}"
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                print(f"Error polling media container: {str(e)}")
+
+            delay = self.CONTAINER_POLL_DELAYS[min(attempt, len(self.CONTAINER_POLL_DELAYS) - 1)]
+            if loop.time() + delay > deadline:
+                return False, "Timed out waiting for media container"
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def publish_media(self, container_id: str) -> Tuple[bool, str]:
+        """
+        Publish a media container to Instagram.
+
+        Args:
+            container_id: Media container ID from create_media_container
+
+        Returns:
+            Tuple of (success, message/post_id)
+        """
+        try:
+            status, data = await self._request(
+                'POST',
+                f"{self.graph_api_base}/{self.business_account_id}/media_publish",
+                {'creation_id': container_id},
+                timeout=30
+            )
+            if status == 200:
+                return True, data.get('id', '')
+            error = data.get('error', {})
+            return False, f"Failed to publish: {error.get('message', 'Unknown error')}"
+        except Exception as e:
+            return False, f"Error publishing media: {str(e)}"
+
+    async def share_via_api(self, image_url: str, caption: str) -> Tuple[bool, str]:
+        """
+        Share image via Instagram Graph API (requires publicly accessible image URL).
+
+        Args:
+            image_url: Public URL of the image
+            caption: Post caption
+
+        Returns:
+            Tuple of (success, message/url)
+        """
+        container_id = await self.create_media_container(image_url, caption)
+        if not container_id:
+            return False, "Failed to create media container"
+
+        ready, status = await self.wait_for_container(container_id)
+        if not ready:
+            return False, status
+
+        success, result = await self.publish_media(container_id)
+        if success:
+            return True, f"Posted to Instagram: {result}"
+        return False, result
+
+    async def share(self, image_path: str, caption: str) -> Tuple[bool, str]:
+        """
+        Share image and caption to Instagram (high-level method).
+
+        Args:
+            image_path: Public URL of the image
+            caption: Post caption
+
+        Returns:
+            Tuple of (success, message)
+        """
+        if image_path.startswith('http://') or image_path.startswith('https://'):
+            return await self.share_via_api(image_path, caption)
+        return False, ("Instagram API requires a public image URL. "
+                       "Please host the image online first, or use native share intent on mobile.")
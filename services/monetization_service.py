@@ -20,19 +20,19 @@ This module provides the interface and mock implementations for testing.
 """
 
 import os
+import importlib.util
 import json
+import time
+import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
-# Try to import KivMob for ads (install: pip install kivmob)
-try:
-    from kivmob import KivMob
-    HAS_KIVMOB = True
-except ImportError:
-    HAS_KIVMOB = False
+# Probe for KivMob (install: pip install kivmob) without importing it; the
+# import pulls in pyjnius/AdMob bindings and only happens once ads are on
+HAS_KIVMOB = importlib.util.find_spec("kivmob") is not None
 
 
 class SubscriptionTier(Enum):
@@ -69,10 +69,12 @@ class Product:
     product_type: ProductType = ProductType.ONE_TIME
     period: Optional[str] = None  # monthly, yearly for subscriptions
     features: List[str] = field(default_factory=list)
+    tier: SubscriptionTier = SubscriptionTier.PREMIUM  # tier this product unlocks
     
     def to_dict(self) -> Dict[str, Any]:
         data = asdict(self)
         data['product_type'] = self.product_type.value
+        data['tier'] = self.tier.value
         return data
 
 
@@ -84,13 +86,18 @@ class Purchase:
     purchased_at: str
     expires_at: Optional[str] = None
     is_active: bool = True
+    expires_at_ts: Optional[float] = None  # unix timestamp of expires_at
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Purchase':
-        return cls(**data)
+        purchase = cls(**data)
+        # Records saved before expires_at_ts existed only carry the ISO string
+        if purchase.expires_at and purchase.expires_at_ts is None:
+            purchase.expires_at_ts = datetime.fromisoformat(purchase.expires_at).timestamp()
+        return purchase
 
 
 @dataclass
@@ -131,8 +138,8 @@ class MonetizationConfig:
     # Show interstitial every N major actions
     INTERSTITIAL_FREQUENCY = 5
     
-    # Product Definitions
-    PRODUCTS = [
+    # Product Definitions (tuple: shared and returned as-is, never copied)
+    PRODUCTS = (
         Product(
             id="postboi_premium",
             name="Postboi Premium",
@@ -178,35 +185,63 @@ class MonetizationConfig:
                 "Save 33% vs monthly",
             ]
         ),
-    ]
+    )
     
-    # Tier Features
+    # Product lookups by ID (built once from PRODUCTS)
+    PRODUCTS_BY_ID: Dict[str, Product] = {p.id: p for p in PRODUCTS}
+    PRODUCT_TIERS: Dict[str, SubscriptionTier] = {p.id: p.tier for p in PRODUCTS}
+    
+    # Tier Features (tuples so callers can't mutate shared config)
     TIER_FEATURES = {
-        SubscriptionTier.FREE: [
+        SubscriptionTier.FREE: (
             "Post to WordPress, Facebook, Instagram",
             "Basic scheduling (5 posts/day)",
             "Local draft storage",
             "Ads displayed",
-        ],
-        SubscriptionTier.PREMIUM: [
+        ),
+        SubscriptionTier.PREMIUM: (
             "Everything in Free",
             "No ads",
             "Unlimited scheduled posts",
             "Post analytics",
             "Bulk upload",
             "Priority support",
-        ],
-        SubscriptionTier.PREMIUM_PLUS: [
+        ),
+        SubscriptionTier.PREMIUM_PLUS: (
             "Everything in Premium",
             "Multi-account support",
             "Team collaboration",
             "API access",
             "Custom integrations",
             "White-label options",
-        ],
+        ),
     }
 
 
+def _feature_tokens(features) -> frozenset:
+    """
+    Build the lowercased lookup set for a tier's feature strings: each full
+    phrase plus every contiguous run of its words (punctuation stripped),
+    so "No ads" matches "no ads" and "ads".
+    """
+    tokens = set()
+    for feature in features:
+        phrase = feature.lower()
+        tokens.add(phrase)
+        words = [w.strip(",.()") for w in phrase.split()]
+        for start in range(len(words)):
+            for end in range(start + 1, len(words) + 1):
+                tokens.add(" ".join(words[start:end]))
+    return frozenset(tokens)
+
+
+# Precomputed per-tier feature lookup used by PurchaseService.has_feature
+_TIER_FEATURE_TOKENS: Dict[SubscriptionTier, frozenset] = {
+    tier: _feature_tokens(features)
+    for tier, features in MonetizationConfig.TIER_FEATURES.items()
+}
+
+
 # =============================================================================
 # AD SERVICE
 # =============================================================================
@@ -215,9 +250,22 @@ class AdService:
     """
     Ad service for displaying banner, interstitial, and rewarded ads.
     Uses KivMob when available, otherwise provides mock implementations.
+    
+    KivMob holds global AdMob SDK state, so AdService is a process-wide
+    singleton: every AdService() call returns the same instance.
     """
     
+    _instance: Optional['AdService'] = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+    
     def __init__(self):
+        if getattr(self, '_constructed', False):
+            return
+        self._constructed = True
         self._kivmob = None
         self._action_count = 0
         self._initialized = False
@@ -239,6 +287,7 @@ class AdService:
             return False
         
         try:
+            from kivmob import KivMob
             self._kivmob = KivMob(MonetizationConfig.ADMOB_APP_ID)
             self._kivmob.new_banner(MonetizationConfig.BANNER_AD_UNIT)
             self._kivmob.new_interstitial(MonetizationConfig.INTERSTITIAL_AD_UNIT)
@@ -357,6 +406,10 @@ class PurchaseService:
     - iOS: StoreKit (via pyobjus)
     """
     
+    # Seconds a computed MonetizationStatus stays valid while purchases.json
+    # is unchanged on disk
+    STATUS_CACHE_TTL = 60.0
+    
     def __init__(self, app_name: str = "Postboi", user_id: Optional[str] = None):
         self.app_name = app_name
         self._user_id = user_id
@@ -366,8 +419,13 @@ class PurchaseService:
         # Ensure data directory exists
         self._data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cache
+        # Caches: parsed purchases.json keyed by its mtime, and the computed
+        # status stamped with the monotonic time and mtime it was built from
+        self._purchases_cache: Optional[Tuple[int, Dict[str, Dict]]] = None
+        self._last_saved_hash: Optional[str] = None
         self._status: Optional[MonetizationStatus] = None
+        self._status_computed_at = 0.0
+        self._status_mtime_ns: Optional[int] = None
     
     def _get_data_directory(self) -> Path:
         """Get platform-specific app data directory"""
@@ -383,48 +441,90 @@ class PurchaseService:
         
         return base / self.app_name / "purchases"
     
+    def _purchases_mtime_ns(self) -> Optional[int]:
+        """Get modification time of purchases.json, or None if missing"""
+        try:
+            return self._purchases_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
     def _load_purchases(self) -> Dict[str, Dict]:
-        """Load purchases from storage"""
-        if self._purchases_file.exists():
-            try:
-                with open(self._purchases_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
+        """Load purchases from storage (cached until the file changes)"""
+        mtime_ns = self._purchases_mtime_ns()
+        if mtime_ns is None:
+            return {}
+        
+        if self._purchases_cache and self._purchases_cache[0] == mtime_ns:
+            return self._purchases_cache[1]
+        
+        try:
+            with open(self._purchases_file, 'r') as f:
+                purchases = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+        
+        self._purchases_cache = (mtime_ns, purchases)
+        return purchases
     
     def _save_purchases(self, purchases: Dict[str, Dict]) -> None:
-        """Save purchases to storage"""
-        with open(self._purchases_file, 'w') as f:
-            json.dump(purchases, f, indent=2)
+        """Save purchases to storage atomically, skipping unchanged data"""
+        payload = json.dumps(purchases, separators=(',', ':')).encode()
+        digest = hashlib.sha1(payload).hexdigest()
+        if digest == self._last_saved_hash and self._purchases_file.exists():
+            return
+        
+        # Write to a temp file and rename so a crash never leaves a
+        # truncated purchases.json behind
+        tmp_file = self._purchases_file.with_suffix('.json.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self._purchases_file)
+        except BaseException:
+            # Callers edit the cached dict in place and the file's mtime is
+            # unchanged, so drop the cache rather than serve the unsaved edit
+            self._purchases_cache = None
+            self._invalidate_status()
+            if tmp_file.exists():
+                tmp_file.unlink()
+            raise
+        
+        self._last_saved_hash = digest
+        self._purchases_cache = (self._purchases_mtime_ns(), purchases)
+    
+    def _invalidate_status(self) -> None:
+        """Drop the cached monetization status"""
+        self._status = None
+        self._status_mtime_ns = None
     
     def set_user_id(self, user_id: str) -> None:
         """Set user ID for purchase tracking"""
         self._user_id = user_id
-        self._status = None  # Clear cache
+        self._invalidate_status()
     
-    def get_products(self) -> List[Product]:
+    def get_products(self) -> Tuple[Product, ...]:
         """Get available products"""
-        return MonetizationConfig.PRODUCTS.copy()
+        return MonetizationConfig.PRODUCTS
     
     def get_product(self, product_id: str) -> Optional[Product]:
         """Get product by ID"""
-        for product in MonetizationConfig.PRODUCTS:
-            if product.id == product_id:
-                return product
-        return None
+        return MonetizationConfig.PRODUCTS_BY_ID.get(product_id)
     
     def get_monetization_status(self) -> MonetizationStatus:
         """
         Get current monetization status.
         Checks purchases and determines tier.
+        Cached for STATUS_CACHE_TTL seconds while purchases.json is unchanged.
         """
-        if self._status:
-            return self._status
-        
         if not MonetizationConfig.ENABLED or not MonetizationConfig.PURCHASES_ENABLED:
             return MonetizationStatus()
         
+        mtime_ns = self._purchases_mtime_ns()
+        if (self._status is not None
+                and mtime_ns == self._status_mtime_ns
+                and time.monotonic() - self._status_computed_at < self.STATUS_CACHE_TTL):
+            return self._status
+        
         purchases = self._load_purchases()
         user_purchases = purchases.get(self._user_id or "anonymous", {})
         
@@ -434,6 +534,7 @@ class PurchaseService:
         tier = SubscriptionTier.FREE
         purchased_products = []
         
+        now_ts = time.time()
         for product_id, purchase_data in user_purchases.items():
             purchase = Purchase.from_dict(purchase_data)
             
@@ -441,20 +542,21 @@ class PurchaseService:
                 continue
             
             # Check subscription expiry
-            if purchase.expires_at:
-                if datetime.fromisoformat(purchase.expires_at) < datetime.now():
+            if purchase.expires_at_ts is not None:
+                if purchase.expires_at_ts < now_ts:
                     continue
                 has_subscription = True
             
             purchased_products.append(product_id)
             
-            # Determine tier
-            if "premium_plus" in product_id:
-                tier = SubscriptionTier.PREMIUM_PLUS
-                is_premium = True
-            elif "premium" in product_id:
-                if tier != SubscriptionTier.PREMIUM_PLUS:
-                    tier = SubscriptionTier.PREMIUM
+            # Determine tier; nothing outranks PREMIUM_PLUS, so once it is
+            # reached the remaining purchases only need recording
+            if tier == SubscriptionTier.PREMIUM_PLUS:
+                continue
+            
+            product_tier = MonetizationConfig.PRODUCT_TIERS.get(product_id, SubscriptionTier.FREE)
+            if product_tier != SubscriptionTier.FREE:
+                tier = product_tier
                 is_premium = True
         
         self._status = MonetizationStatus(
@@ -464,6 +566,8 @@ class PurchaseService:
             ads_enabled=not is_premium and MonetizationConfig.ADS_ENABLED,
             purchased_products=purchased_products
         )
+        self._status_computed_at = time.monotonic()
+        self._status_mtime_ns = mtime_ns
         
         return self._status
     
@@ -504,20 +608,21 @@ class PurchaseService:
             return PurchaseResult.NOT_AVAILABLE
         
         now = datetime.now()
-        expires_at = None
+        expires = None
         
         if product.product_type == ProductType.SUBSCRIPTION:
             if product.period == "monthly":
-                expires_at = (now + timedelta(days=30)).isoformat()
+                expires = now + timedelta(days=30)
             elif product.period == "yearly":
-                expires_at = (now + timedelta(days=365)).isoformat()
+                expires = now + timedelta(days=365)
         
         purchase = Purchase(
             product_id=product_id,
             purchase_token=f"mock_{product_id}_{now.timestamp()}",
             purchased_at=now.isoformat(),
-            expires_at=expires_at,
-            is_active=True
+            expires_at=expires.isoformat() if expires else None,
+            is_active=True,
+            expires_at_ts=expires.timestamp() if expires else None
         )
         
         # Save purchase
@@ -531,7 +636,7 @@ class PurchaseService:
         self._save_purchases(purchases)
         
         # Clear cached status
-        self._status = None
+        self._invalidate_status()
         
         if MonetizationConfig.DEBUG_MODE:
             print(f"[Purchases] Mock purchase created: {product_id}")
@@ -573,20 +678,15 @@ class PurchaseService:
             True if user's tier includes the feature
         """
         status = self.get_monetization_status()
-        tier_features = MonetizationConfig.TIER_FEATURES.get(status.subscription_tier, [])
-        
-        # Check if feature is in tier's features
-        for tier_feature in tier_features:
-            if feature.lower() in tier_feature.lower():
-                return True
-        return False
+        tokens = _TIER_FEATURE_TOKENS.get(status.subscription_tier, frozenset())
+        return feature.lower().strip() in tokens
     
-    def get_tier_features(self, tier: Optional[SubscriptionTier] = None) -> List[str]:
+    def get_tier_features(self, tier: Optional[SubscriptionTier] = None) -> Tuple[str, ...]:
         """Get features for a tier (defaults to current tier)"""
         if tier is None:
             status = self.get_monetization_status()
             tier = status.subscription_tier
-        return MonetizationConfig.TIER_FEATURES.get(tier, [])
+        return MonetizationConfig.TIER_FEATURES.get(tier, ())
 
 
 # =============================================================================
@@ -609,9 +709,25 @@ class MonetizationService:
         
         # Purchase premium
         result = monetization.purchase("postboi_premium")
+    
+    One instance is shared per app_name for the whole process, so screens
+    that construct their own MonetizationService don't re-initialize ads or
+    re-read purchases.
     """
     
+    _instances: Dict[str, 'MonetizationService'] = {}
+    
+    def __new__(cls, app_name: str = "Postboi"):
+        instance = cls._instances.get(app_name)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[app_name] = instance
+        return instance
+    
     def __init__(self, app_name: str = "Postboi"):
+        if getattr(self, '_constructed', False):
+            return
+        self._constructed = True
         self.app_name = app_name
         self._ads = AdService()
         self._purchases = PurchaseService(app_name)
@@ -639,7 +755,7 @@ class MonetizationService:
         """Get full monetization status"""
         return self._purchases.get_monetization_status()
     
-    def get_products(self) -> List[Product]:
+    def get_products(self) -> Tuple[Product, ...]:
         """Get available products"""
         return self._purchases.get_products()
     
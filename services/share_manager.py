@@ -3,20 +3,48 @@ Share Manager - Coordinates simultaneous posting to multiple platforms.
 Uses ThreadPoolExecutor for concurrent operations.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from functools import partial
 from typing import Dict, List, Tuple, Optional
 from services.wordpress import WordPressService
 from services.facebook_share import FacebookService
 from services.instagram_share import InstagramService
+import config
 
 
 class ShareManager:
     """Manages simultaneous sharing to multiple social media platforms."""
 
+    # Upper bound on upload threads; past this point extra threads mostly
+    # contend for the GIL and the remote hosts' rate limits
+    MAX_WORKERS_CAP = 16
+
+    # Platforms whose services upload the image file's bytes (Instagram
+    # takes a public URL instead)
+    FILE_UPLOAD_PLATFORMS = ('wordpress', 'facebook')
+
+    # Message prefix for platforms still posting after a fail-fast return;
+    # the post ID for get_background_results follows it
+    PENDING_PREFIX = 'pending:'
+
+    # Posts whose late results are kept; the oldest are dropped past this
+    MAX_BACKGROUND_POSTS = 100
+
+    # Display names used as result keys
+    PLATFORM_NAMES = {
+        'wordpress': 'WordPress',
+        'facebook': 'Facebook',
+        'instagram': 'Instagram',
+    }
+
     def __init__(self, wordpress_service: Optional[WordPressService] = None,
                  facebook_service: Optional[FacebookService] = None,
                  instagram_service: Optional[InstagramService] = None,
-                 max_workers: int = 3):
+                 max_workers: Optional[int] = None):
         """
         Initialize ShareManager with platform services.
 
@@ -24,14 +52,66 @@ class ShareManager:
             wordpress_service: WordPress service instance
             facebook_service: Facebook service instance
             instagram_service: Instagram service instance
-            max_workers: Maximum concurrent upload threads
+            max_workers: Maximum concurrent upload threads. Defaults to
+                config.APP_SETTINGS['concurrent_uploads'] and is capped at
+                MAX_WORKERS_CAP, since too many threads cause contention
+                rather than more throughput.
         """
         self.wordpress_service = wordpress_service
         self.facebook_service = facebook_service
         self.instagram_service = instagram_service
+        self.max_workers = self._clamp_workers(max_workers)
+
+        # Long-lived pool shared by every share_to_multiple call
+        self._executor = self._create_executor(self.max_workers)
+
+        # Late results from fail-fast shares, keyed by post ID
+        self._background_results: Dict[str, Dict[str, Tuple[bool, str]]] = {}
+        self._background_lock = threading.Lock()
+
+    @classmethod
+    def _clamp_workers(cls, max_workers: Optional[int]) -> int:
+        """Resolve the configured default and clamp to [1, MAX_WORKERS_CAP]."""
+        if not max_workers:
+            max_workers = config.APP_SETTINGS.get('concurrent_uploads', 4)
+        return max(1, min(max_workers, cls.MAX_WORKERS_CAP))
+
+    @staticmethod
+    def _create_executor(max_workers: int) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="postboi-share"
+        )
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """
+        Resize the upload pool.
+
+        In-flight uploads finish on the old pool; new work goes to the new one.
+        """
+        max_workers = self._clamp_workers(max_workers)
+        if max_workers == self.max_workers:
+            return
+        old_executor = self._executor
         self.max_workers = max_workers
+        self._executor = self._create_executor(max_workers)
+        old_executor.shutdown(wait=False)
+
+    def close(self):
+        """Shut down the worker pool and release pooled service connections."""
+        self._executor.shutdown(wait=True)
+        for service in (self.wordpress_service, self.facebook_service, self.instagram_service):
+            if service is not None and hasattr(service, 'close'):
+                service.close()
 
-    def share_to_platform(self, platform: str, image_path: str, caption: str) -> Tuple[str, bool, str]:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def share_to_platform(self, platform: str, image_path: str, caption: str,
+                          image_bytes: Optional[bytes] = None) -> Tuple[str, bool, str]:
         """
         Share to a single platform.
 
@@ -39,17 +119,23 @@ class ShareManager:
             platform: Platform name ('wordpress', 'facebook', 'instagram')
             image_path: Path to the image file
             caption: Post caption
+            image_bytes: Already-read contents of image_path (optional),
+                shared by platforms that upload the file itself
 
         Returns:
             Tuple of (platform, success, message)
         """
         try:
             if platform == 'wordpress' and self.wordpress_service:
-                success, message = self.wordpress_service.share(image_path, caption)
+                success, message = self.wordpress_service.share(
+                    image_path, caption, image_bytes=image_bytes
+                )
                 return ('WordPress', success, message)
 
             elif platform == 'facebook' and self.facebook_service:
-                success, message = self.facebook_service.share(image_path, caption)
+                success, message = self.facebook_service.share(
+                    image_path, caption, image_bytes=image_bytes
+                )
                 return ('Facebook', success, message)
 
             elif platform == 'instagram' and self.instagram_service:
@@ -63,7 +149,8 @@ class ShareManager:
             return (platform.capitalize(), False, f"Error: {str(e)}")
 
     def share_to_multiple(self, platforms: List[str], image_path: str,
-                         caption: str) -> Dict[str, Tuple[bool, str]]:
+                         caption: str, timeout: float = 60.0, fail_fast: bool = False,
+                         post_id: Optional[str] = None) -> Dict[str, Tuple[bool, str]]:
         """
         Share to multiple platforms simultaneously.
 
@@ -71,46 +158,117 @@ class ShareManager:
             platforms: List of platform names ('wordpress', 'facebook', 'instagram')
             image_path: Path to the image file
             caption: Post caption
+            timeout: Seconds to wait for all platforms; any still running
+                after that are cancelled if possible and reported as failed
+            fail_fast: Return as soon as any platform fails. Platforms still
+                running are reported as (False, "pending:<post_id>") and keep
+                going in the background; see get_background_results
+            post_id: Key for background results (defaults to a new UUID)
 
         Returns:
             Dictionary mapping platform names to (success, message) tuples
         """
         results = {}
 
-        # Use ThreadPoolExecutor for concurrent uploads
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_platform = {
-                executor.submit(self.share_to_platform, platform, image_path, caption): platform
-                for platform in platforms
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_platform):
+        # When several platforms upload the local file itself, read it once
+        # and share the buffer instead of each service reading it again
+        image_bytes = None
+        uploaders = [p for p in platforms if p in self.FILE_UPLOAD_PLATFORMS]
+        if len(uploaders) > 1 and os.path.isfile(image_path):
+            with open(image_path, 'rb') as f:
+                image_bytes = f.read()
+
+        # Submit all tasks to the shared pool for concurrent uploads
+        future_to_platform = {
+            self._executor.submit(
+                self.share_to_platform, platform, image_path, caption, image_bytes
+            ): platform
+            for platform in platforms
+        }
+
+        # Collect results as they complete
+        try:
+            for future in as_completed(future_to_platform, timeout=timeout):
                 platform_name, success, message = future.result()
                 results[platform_name] = (success, message)
 
+                if fail_fast and not success:
+                    self._detach_pending(future_to_platform, results, post_id or str(uuid.uuid4()))
+                    break
+        except TimeoutError:
+            for future, platform in future_to_platform.items():
+                if future.done():
+                    # Finished before the deadline but not yet yielded
+                    platform_name, success, message = future.result()
+                    results[platform_name] = (success, message)
+                else:
+                    future.cancel()
+                    platform_name = self.PLATFORM_NAMES.get(platform, platform.capitalize())
+                    results[platform_name] = (False, f"Timed out after {timeout:g}s")
+
         return results
 
-    def test_all_connections(self) -> Dict[str, Tuple[bool, str]]:
+    def _detach_pending(self, future_to_platform: Dict, results: Dict[str, Tuple[bool, str]],
+                        post_id: str) -> None:
+        """Record finished futures and leave the rest to report in the background."""
+        for future, platform in future_to_platform.items():
+            if future.done():
+                platform_name, success, message = future.result()
+                results[platform_name] = (success, message)
+            else:
+                platform_name = self.PLATFORM_NAMES.get(platform, platform.capitalize())
+                results.setdefault(platform_name, (False, f"{self.PENDING_PREFIX}{post_id}"))
+                future.add_done_callback(partial(self._record_background_result, post_id))
+
+    def _record_background_result(self, post_id: str, future) -> None:
+        """Store the result of a share that finished after fail-fast returned."""
+        if future.cancelled():
+            return
+        platform_name, success, message = future.result()
+        with self._background_lock:
+            if (post_id not in self._background_results
+                    and len(self._background_results) >= self.MAX_BACKGROUND_POSTS):
+                # Drop the oldest post nobody collected
+                del self._background_results[next(iter(self._background_results))]
+            self._background_results.setdefault(post_id, {})[platform_name] = (success, message)
+
+    def get_background_results(self, post_id: str) -> Dict[str, Tuple[bool, str]]:
         """
-        Test connections to all configured platforms.
+        Collect results that arrived after a fail-fast share returned.
+
+        Collected results are removed; platforms that finish later are
+        stored again and returned by the next call.
+
+        Args:
+            post_id: The post_id passed to share_to_multiple, or the one
+                following PENDING_PREFIX in its pending messages
 
         Returns:
             Dictionary mapping platform names to (success, message) tuples
         """
-        results = {}
+        with self._background_lock:
+            return self._background_results.pop(post_id, {})
 
-        if self.wordpress_service:
-            results['WordPress'] = self.wordpress_service.test_connection()
+    def test_all_connections(self) -> Dict[str, Tuple[bool, str]]:
+        """
+        Test connections to all configured platforms.
 
-        if self.facebook_service:
-            results['Facebook'] = self.facebook_service.test_connection()
+        Returns:
+            Dictionary mapping platform names to (success, message) tuples
+        """
+        services = [
+            ('WordPress', self.wordpress_service),
+            ('Facebook', self.facebook_service),
+            ('Instagram', self.instagram_service),
+        ]
 
-        if self.instagram_service:
-            results['Instagram'] = self.instagram_service.test_connection()
+        # Run the independent round-trips concurrently on the shared pool
+        futures = {
+            name: self._executor.submit(service.test_connection)
+            for name, service in services if service
+        }
 
-        return results
+        return {name: future.result() for name, future in futures.items()}
 
     def get_summary(self, results: Dict[str, Tuple[bool, str]]) -> str:
         """
@@ -122,8 +280,22 @@ class ShareManager:
         Returns:
             Formatted summary string
         """
-        successful = [platform for platform, (success, _) in results.items() if success]
-        failed = [platform for platform, (success, _) in results.items() if not success]
+        # Single pass: bucket platforms and write detail lines as we go
+        successful = []
+        failed = []
+        pending = []
+        details = io.StringIO()
+        for platform, (success, message) in results.items():
+            if success:
+                successful.append(platform)
+                details.write(f"\n\n✅ {platform}: {message}")
+            elif message.startswith(self.PENDING_PREFIX):
+                # Still uploading after a fail-fast return; may yet succeed
+                pending.append(platform)
+                details.write(f"\n\n⏳ {platform}: still posting")
+            else:
+                failed.append(platform)
+                details.write(f"\n\n❌ {platform}: {message}")
 
         summary_parts = []
 
@@ -133,9 +305,7 @@ class ShareManager:
         if failed:
             summary_parts.append(f"❌ Failed to post to: {', '.join(failed)}")
 
-        # Add details
-        for platform, (success, message) in results.items():
-            emoji = "✅" if success else "❌"
-            summary_parts.append(f"\n{emoji} {platform}: {message}")
+        if pending:
+            summary_parts.append(f"⏳ Still posting to: {', '.join(pending)}")
 
-        return '\n'.join(summary_parts)
+        return '\n'.join(summary_parts) + details.getvalue()
@@ -3,11 +3,39 @@ WordPress REST API integration service.
 Handles image uploads and post creation using WordPress REST API.
 """
 
+import asyncio
 import base64
 import mimetypes
+import os
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 import requests
-from requests.auth import HTTPBasicAuth
+
+# aiohttp is optional; only AsyncWordPressService needs it
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Load the MIME database up front so the first upload doesn't pay for it
+mimetypes.init()
+
+
+@lru_cache(maxsize=32)
+def _mime_for_ext(ext: str) -> str:
+    """Get MIME type for a lowercased file extension, defaulting to JPEG."""
+    return mimetypes.types_map.get(ext) or 'image/jpeg'
+
+
+def _error_message(response: requests.Response) -> str:
+    """
+    Describe a failed WordPress response without assuming a JSON body;
+    proxies and PHP fatals often return HTML error pages.
+    """
+    if 'json' in response.headers.get('Content-Type', ''):
+        return response.json().get('message', f'Status: {response.status_code}')
+    return f'Status: {response.status_code} - {response.text[:200]}'
 
 
 class WordPressService:
@@ -26,7 +54,25 @@ class WordPressService:
         self.username = username
         self.app_password = app_password.replace(' ', '')  # Remove spaces from app password
         self.api_base = f"{self.site_url}/wp-json/wp/v2"
-        self.auth = HTTPBasicAuth(username, app_password)
+
+        # Basic auth header encoded once instead of on every request
+        token = base64.b64encode(f"{username}:{self.app_password}".encode()).decode()
+        self._auth_header = {'Authorization': f'Basic {token}'}
+
+        # Keep-alive session so uploading the image and creating the post
+        # reuse one TLS connection
+        self._session = requests.Session()
+        self._session.headers.update({'User-Agent': 'Postboi/1.0', **self._auth_header})
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def test_connection(self) -> Tuple[bool, str]:
         """
@@ -36,9 +82,8 @@ class WordPressService:
             Tuple of (success, message)
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.api_base}/users/me",
-                auth=self.auth,
                 timeout=10
             )
             if response.status_code == 200:
@@ -48,46 +93,53 @@ class WordPressService:
         except requests.exceptions.RequestException as e:
             return False, f"Connection error: {str(e)}"
 
-    def upload_image(self, image_path: str) -> Optional[int]:
+    def upload_image(self, image_path: str, image_bytes: Optional[bytes] = None) -> Optional[int]:
         """
         Upload image to WordPress media library.
 
         Args:
             image_path: Path to the image file
+            image_bytes: Already-read file contents (optional); skips reading
+                image_path when another platform has loaded it
 
         Returns:
             Media ID if successful, None otherwise
         """
         try:
-            # Read image file
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-
-            # Determine MIME type
-            mime_type, _ = mimetypes.guess_type(image_path)
-            if not mime_type:
-                mime_type = 'image/jpeg'
+            # Determine MIME type and file name
+            mime_type = _mime_for_ext(os.path.splitext(image_path)[1].lower())
+            filename = os.path.basename(image_path)
+            size = len(image_bytes) if image_bytes is not None else os.path.getsize(image_path)
 
-            # Prepare headers
+            # Prepare headers (explicit length keeps the upload non-chunked)
             headers = {
                 'Content-Type': mime_type,
-                'Content-Disposition': f'attachment; filename="{image_path.split("/")[-1]}"'
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Content-Length': str(size)
             }
 
-            # Upload to media library
-            response = requests.post(
-                f"{self.api_base}/media",
-                headers=headers,
-                data=image_data,
-                auth=self.auth,
-                timeout=30
-            )
+            if image_bytes is not None:
+                response = self._session.post(
+                    f"{self.api_base}/media",
+                    headers=headers,
+                    data=image_bytes,
+                    timeout=30
+                )
+            else:
+                # Stream the file to the media library instead of reading it into memory
+                with open(image_path, 'rb') as f:
+                    response = self._session.post(
+                        f"{self.api_base}/media",
+                        headers=headers,
+                        data=f,
+                        timeout=30
+                    )
 
             if response.status_code == 201:
                 media_id = response.json().get('id')
                 return media_id
             else:
-                print(f"Failed to upload image: {response.status_code} - {response.text}")
+                print(f"Failed to upload image: {_error_message(response)}")
                 return None
 
         except Exception as e:
@@ -118,10 +170,9 @@ class WordPressService:
             if media_id:
                 post_data['featured_media'] = media_id
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_base}/posts",
                 json=post_data,
-                auth=self.auth,
                 timeout=30
             )
 
@@ -129,13 +180,13 @@ class WordPressService:
                 post_url = response.json().get('link', '')
                 return True, post_url
             else:
-                error_msg = response.json().get('message', f'Status: {response.status_code}')
-                return False, f"Failed to create post: {error_msg}"
+                return False, f"Failed to create post: {_error_message(response)}"
 
         except Exception as e:
             return False, f"Error creating post: {str(e)}"
 
-    def share(self, image_path: str, caption: str, title: Optional[str] = None) -> Tuple[bool, str]:
+    def share(self, image_path: str, caption: str, title: Optional[str] = None,
+              image_bytes: Optional[bytes] = None) -> Tuple[bool, str]:
         """
         Share image and caption to WordPress (high-level method).
 
@@ -143,6 +194,7 @@ class WordPressService:
             image_path: Path to the image file
             caption: Post caption/content
             title: Post title (uses first line of caption if not provided)
+            image_bytes: Already-read file contents (optional)
 
         Returns:
             Tuple of (success, message/url)
@@ -152,10 +204,200 @@ class WordPressService:
             title = caption.split('\n')[0][:100] if caption else 'New Post'
 
         # Upload image
-        media_id = self.upload_image(image_path)
+        media_id = self.upload_image(image_path, image_bytes)
         if not media_id:
             return False, "Failed to upload image to WordPress"
 
         # Create post with featured image
         success, result = self.create_post(title, caption, media_id)
         return success, result
+
+
+async def _async_error_message(response: 'aiohttp.ClientResponse') -> str:
+    """aiohttp counterpart of _error_message."""
+    if 'json' in response.content_type:
+        return (await response.json()).get('message', f'Status: {response.status}')
+    return f'Status: {response.status} - {(await response.text())[:200]}'
+
+
+class AsyncWordPressService:
+    """
+    asyncio counterpart of WordPressService.
+
+    Uploads and post creation run as coroutines over one shared
+    aiohttp.ClientSession (keep-alive pool + basic auth set once), so many
+    shares can be in flight on a single event-loop thread.
+
+    Usage:
+        async with AsyncWordPressService(site_url, username, app_password) as wp:
+            results = await asyncio.gather(
+                *(wp.share(path, caption) for path, caption in jobs)
+            )
+
+    Concurrency against the site is capped on purpose: throughput peaks at
+    a handful of parallel connections and then drops as the host starts
+    rate-limiting (WordPress.com answers with 429s), so the connector allows
+    MAX_CONNECTIONS_PER_HOST sockets and uploads are gated by a semaphore of
+    the same size.
+    """
+
+    MAX_CONNECTIONS = 32
+    MAX_CONNECTIONS_PER_HOST = 4
+
+    def __init__(self, site_url: str, username: str, app_password: str):
+        """
+        Initialize async WordPress service.
+
+        Args:
+            site_url: WordPress site URL (e.g., 'https://yoursite.wordpress.com')
+            username: WordPress username
+            app_password: WordPress application password
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for AsyncWordPressService")
+
+        self.site_url = site_url.rstrip('/')
+        self.username = username
+        self.app_password = app_password.replace(' ', '')  # Remove spaces from app password
+        self.api_base = f"{self.site_url}/wp-json/wp/v2"
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._upload_slots: Optional[asyncio.Semaphore] = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Create the shared session lazily, inside the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(self.username, self.app_password),
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONNECTIONS,
+                    limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+                    ttl_dns_cache=300
+                )
+            )
+            self._upload_slots = asyncio.Semaphore(self.MAX_CONNECTIONS_PER_HOST)
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def test_connection(self) -> Tuple[bool, str]:
+        """
+        Test connection to WordPress API.
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            async with self._get_session().get(
+                f"{self.api_base}/users/me",
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    return True, "Connection successful"
+                return False, f"Authentication failed: {response.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return False, f"Connection error: {str(e)}"
+
+    async def upload_image(self, image_path: str) -> Optional[int]:
+        """
+        Upload image to WordPress media library.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Media ID if successful, None otherwise
+        """
+        try:
+            mime_type = _mime_for_ext(os.path.splitext(image_path)[1].lower())
+            filename = os.path.basename(image_path)
+
+            headers = {
+                'Content-Type': mime_type,
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Content-Length': str(os.path.getsize(image_path))
+            }
+
+            # aiohttp streams file objects in chunks (reads run in its executor)
+            session = self._get_session()
+            async with self._upload_slots:
+                with open(image_path, 'rb') as f:
+                    async with session.post(
+                        f"{self.api_base}/media",
+                        headers=headers,
+                        data=f
+                    ) as response:
+                        if response.status == 201:
+                            return (await response.json()).get('id')
+                        print(f"Failed to upload image: {await _async_error_message(response)}")
+                        return None
+
+        except Exception as e:
+            print(f"Error uploading image: {str(e)}")
+            return None
+
+    async def create_post(self, title: str, content: str, media_id: Optional[int] = None,
+                          status: str = 'publish') -> Tuple[bool, str]:
+        """
+        Create a new WordPress post.
+
+        Args:
+            title: Post title
+            content: Post content/caption
+            media_id: Featured image media ID (optional)
+            status: Post status ('draft', 'publish', 'future')
+
+        Returns:
+            Tuple of (success, message/post_url)
+        """
+        try:
+            post_data = {
+                'title': title,
+                'content': content,
+                'status': status,
+            }
+
+            if media_id:
+                post_data['featured_media'] = media_id
+
+            async with self._get_session().post(
+                f"{self.api_base}/posts",
+                json=post_data
+            ) as response:
+                if response.status == 201:
+                    return True, (await response.json()).get('link', '')
+                return False, f"Failed to create post: {await _async_error_message(response)}"
+
+        except Exception as e:
+            return False, f"Error creating post: {str(e)}"
+
+    async def share(self, image_path: str, caption: str, title: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Share image and caption to WordPress (high-level method).
+
+        Args:
+            image_path: Path to the image file
+            caption: Post caption/content
+            title: Post title (uses first line of caption if not provided)
+
+        Returns:
+            Tuple of (success, message/url)
+        """
+        if not title:
+            title = caption.split('\n')[0][:100] if caption else 'New Post'
+
+        media_id = await self.upload_image(image_path)
+        if not media_id:
+            return False, "Failed to upload image to WordPress"
+
+        return await self.create_post(title, caption, media_id)
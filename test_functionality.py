@@ -10,274 +10,283 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-print("=" * 60)
-print("Postboi Functionality Test")
-print("=" * 60)
-
-# Test 1: Import all modules
-print("\n1. Testing Module Imports...")
-try:
-    import config
-    from services import WordPressService, FacebookService, InstagramService, ShareManager
-    from utils import ImageUtils, ImageFilters
-    from features import PostTemplates, Scheduler
-    print("   ✓ All modules imported successfully")
-except Exception as e:
-    print(f"   ✗ Import error: {str(e)}")
-    sys.exit(1)
-
-# Test 2: Template System
-print("\n2. Testing Template System...")
-try:
-    templates = PostTemplates()
-    all_templates = templates.get_all_templates()
-    print(f"   ✓ Found {len(all_templates)} default templates")
-    
-    # List template names
-    template_names = [t['name'] for t in all_templates]
-    print(f"   Templates: {', '.join(template_names[:5])}...")
-    
-    # Test template application
-    test_vars = {
-        'content': 'This is a test post!',
-        'author': 'Test User'
-    }
-    result = templates.apply_template('Quote', test_vars)
-    if result:
-        print(f"   ✓ Template application successful")
-        print(f"   Sample output: {result[:50]}...")
-    
-except Exception as e:
-    print(f"   ✗ Template error: {str(e)}")
-
-# Test 3: Image Filters
-print("\n3. Testing Image Filter System...")
-try:
-    filters = ImageFilters()
-    available_filters = filters.get_available_filters()
-    print(f"   ✓ Found {len(available_filters)} available filters")
-    print(f"   Filters: {', '.join(available_filters)}")
-except Exception as e:
-    print(f"   ✗ Filter error: {str(e)}")
-
-# Test 4: Image Utils
-print("\n4. Testing Image Utilities...")
-try:
-    import tempfile
-    image_utils = ImageUtils()
-    print(f"   ✓ ImageUtils initialized")
-    
-    # Test validation (with a non-existent file using portable path)
-    nonexistent_path = os.path.join(tempfile.gettempdir(), 'nonexistent.jpg')
-    is_valid, msg = image_utils.validate_image(nonexistent_path)
-    if not is_valid:
-        print(f"   ✓ Image validation works (correctly detected missing file)")
-    
-except Exception as e:
-    print(f"   ✗ Image utils error: {str(e)}")
-
-# Test 5: Service Initialization
-print("\n5. Testing Service Configuration...")
-try:
-    # Check if services are configured
-    wp_configured = (
-        config.WORDPRESS_CONFIG.get('site_url') != 'https://yoursite.wordpress.com'
-    )
-    fb_configured = (
-        config.FACEBOOK_CONFIG.get('page_id') != 'your_page_id'
-    )
-    ig_configured = (
-        config.INSTAGRAM_CONFIG.get('business_account_id') != 'your_instagram_business_account_id'
-    )
-    
-    print(f"   WordPress: {'✓ Configured' if wp_configured else '○ Not configured (template)'}")
-    print(f"   Facebook:  {'✓ Configured' if fb_configured else '○ Not configured (template)'}")
-    print(f"   Instagram: {'✓ Configured' if ig_configured else '○ Not configured (template)'}")
-    
-    if not (wp_configured or fb_configured or ig_configured):
-        print("   ℹ  Create a .env file from .env.template and add your credentials for full functionality")
-    
-except Exception as e:
-    print(f"   ✗ Configuration error: {str(e)}")
-
-# Test 6: App Settings
-print("\n6. Testing App Settings...")
-try:
-    print(f"   Max image size: {config.APP_SETTINGS['max_image_size_mb']} MB")
-    print(f"   Supported formats: {', '.join(config.APP_SETTINGS['supported_formats'])}")
-    print(f"   Max caption length: {config.APP_SETTINGS['max_caption_length']} chars")
-    print(f"   Concurrent uploads: {config.APP_SETTINGS['concurrent_uploads']}")
-    print("   ✓ App settings loaded successfully")
-except Exception as e:
-    print(f"   ✗ Settings error: {str(e)}")
-
-# Test 7: Essay Drafter
-print("\n7. Testing Essay Drafter...")
-try:
-    from features import EssayDrafter
-    
-    # Check if Anthropic is configured
-    has_valid_api_key = (
-        config.ANTHROPIC_CONFIG.get('api_key') != config.PLACEHOLDER_ANTHROPIC_API_KEY
-    )
-    
-    # Initialize essay drafter
-    drafter = EssayDrafter(
-        api_key=config.ANTHROPIC_CONFIG.get('api_key', ''),
-        model=config.ANTHROPIC_CONFIG.get('model', 'claude-3-5-sonnet-20241022')
-    )
-    
-    print("   ✓ Essay Drafter initialized")
-    
-    # Check for authorial voice files
-    voice_files = drafter.get_voice_file_names()
-    if voice_files:
-        print(f"   ✓ Found {len(voice_files)} authorial voice file(s):")
-        for vf in voice_files:
-            print(f"     - {vf}")
-    else:
-        print("   ○ No authorial voice files found (add .txt files to authorial_styles/)")
-    
-    print(f"   Anthropic API: {'✓ Configured' if has_valid_api_key else '○ Not configured (template)'}")
-    
-    if not has_valid_api_key:
-        print("   ℹ  Edit config.py to add your Anthropic API key for full functionality")
-    
-except Exception as e:
-    print(f"   ✗ Essay Drafter error: {str(e)}")
-# Test 7: Unified Workflow Configuration
-print("\n7. Testing Unified Workflow Configuration...")
-try:
-    from config import (
-        UNIFIED_WORKFLOW_CONFIG, 
-        PLATFORM_REQUIREMENTS,
-        adjust_caption_for_platform,
-        adjust_image_for_platform
-    )
-    
-    print(f"   Max retry attempts: {UNIFIED_WORKFLOW_CONFIG['max_retry_attempts']}")
-    print(f"   Retry delay: {UNIFIED_WORKFLOW_CONFIG['retry_delay']}s")
-    print(f"   Request timeout: {UNIFIED_WORKFLOW_CONFIG['timeout']}s")
-    print("   ✓ Unified workflow configuration loaded")
-    
-    # Test platform requirements
-    print(f"\n   Platform Requirements:")
-    for platform, reqs in PLATFORM_REQUIREMENTS.items():
-        print(f"     • {platform.capitalize()}:")
-        print(f"       - Max caption: {reqs.get('max_caption_length', 'unlimited')}")
-        print(f"       - Max image size: {reqs.get('max_image_size', 'flexible')}")
-    
-except Exception as e:
-    print(f"   ✗ Unified workflow error: {str(e)}")
-
-# Test 8: Caption Adjustment Function
-print("\n8. Testing Caption Adjustment...")
-try:
-    from config import adjust_caption_for_platform
-    
-    # Test with a caption containing many hashtags
-    test_caption = "Amazing post! " + " ".join([f"#tag{i}" for i in range(40)])
-    
-    # Test Instagram (max 30 hashtags)
-    ig_caption = adjust_caption_for_platform(test_caption, 'instagram')
-    ig_hashtags = [word for word in ig_caption.split() if word.startswith('#')]
-    print(f"   Instagram hashtag limit: {len(ig_hashtags)} <= 30")
-    
-    if len(ig_hashtags) <= 30:
-        print("   ✓ Instagram caption adjustment works correctly")
-    else:
-        print(f"   ✗ Instagram caption has too many hashtags: {len(ig_hashtags)}")
-    
-    # Test WordPress (no limits)
-    wp_caption = adjust_caption_for_platform(test_caption, 'wordpress')
-    print(f"   ✓ WordPress caption adjustment works")
-    
-    # Test Facebook
-    fb_caption = adjust_caption_for_platform(test_caption, 'facebook')
-    print(f"   ✓ Facebook caption adjustment works")
-    
-except Exception as e:
-    print(f"   ✗ Caption adjustment error: {str(e)}")
-
-# Test 9: Image Adjustment Function (Mock Test)
-print("\n9. Testing Image Adjustment Function...")
-try:
-    import tempfile
-    from config import adjust_image_for_platform
-    
-    # We can't test with a real image without creating one,
-    # but we can verify the function exists and handles missing files
-    nonexistent_path = os.path.join(tempfile.gettempdir(), 'nonexistent.jpg')
-    result = adjust_image_for_platform(nonexistent_path, 'instagram')
-    print("   ✓ Image adjustment function is available")
-    
-except Exception as e:
-    print(f"   ✗ Image adjustment error: {str(e)}")
-
-# Test 10: Environment Variable Support
-print("\n10. Testing Environment Variable Support...")
-try:
-    import os
-    from dotenv import load_dotenv
-    
-    # Check if .env file exists
-    env_file = os.path.join(os.path.dirname(__file__), '.env')
-    if os.path.exists(env_file):
-        print("   ✓ .env file found")
-        load_dotenv(env_file)
-        print("   ✓ Environment variables loaded from .env")
-    else:
-        print("   ○ No .env file (optional)")
-        print("   ℹ  Create .env from .env.example for environment-based configuration")
-    
-    print("   ✓ python-dotenv module working correctly")
-    
-except Exception as e:
-    print(f"   ✗ Environment variable error: {str(e)}")
-
-# Test 11: Unified Workflow Function (Without Actual Upload)
-print("\n11. Testing Unified Workflow Function...")
-try:
-    from config import unified_post_workflow, get_unified_workflow_summary
-    
-    print("   ✓ unified_post_workflow function is available")
-    print("   ✓ get_unified_workflow_summary function is available")
-    
-    # Test summary generation with mock results
-    mock_results = {
-        'WordPress': (True, 'https://example.com/post/123', []),
-        'Facebook': (False, 'Authentication failed', ['Attempt 1 failed: Invalid token', 'Attempt 2 failed: Invalid token']),
-        'Instagram': (True, 'Posted to Instagram: 12345', []),
-    }
-    
-    summary = get_unified_workflow_summary(mock_results)
-    print("   ✓ Summary generation works")
-    print("\n   Sample Summary Output:")
-    print("   " + "\n   ".join(summary.split('\n')[:10]))
-    
-except Exception as e:
-    print(f"   ✗ Unified workflow function error: {str(e)}")
-
-# Summary
-print("\n" + "=" * 60)
-print("Test Summary")
-print("=" * 60)
-print("All core functionality tests passed!")
-print("\nNew Features Added:")
-print("✓ Unified posting workflow with retry logic")
-print("✓ Platform-specific caption adjustments")
-print("✓ Platform-specific image size adjustments")
-print("✓ Environment variable support (.env)")
-print("✓ Enhanced error logging and reporting")
-print("\nNext steps:")
-print("1. Edit config.py with your platform credentials")
-print("2. Add Anthropic API key for essay drafting feature")
-print("3. Add authorial voice files to authorial_styles/ directory")
-print("4. Install Tesseract OCR: sudo apt install tesseract-ocr (Linux)")
-print("5. Run 'python main.py' to launch the app (requires Kivy)")
-print("6. Or build for mobile with 'buildozer android debug'")
-print("1. Create a .env file from .env.template and add your platform credentials")
-print("2. Run 'python main.py' to launch the app (requires Kivy)")
-print("3. Or build for mobile with 'buildozer android debug'")
-print("4. See web/, ios/, and android/ directories for platform-specific starter templates")
-print("=" * 60)
+
+def main():
+    """Run the functionality checks."""
+    print("=" * 60)
+    print("Postboi Functionality Test")
+    print("=" * 60)
+
+    # Test 1: Import all modules
+    print("\n1. Testing Module Imports...")
+    try:
+        import config
+        from services import WordPressService, FacebookService, InstagramService, ShareManager
+        from utils import ImageUtils, ImageFilters
+        from features import PostTemplates, Scheduler
+        print("   ✓ All modules imported successfully")
+    except Exception as e:
+        print(f"   ✗ Import error: {str(e)}")
+        sys.exit(1)
+
+    # Test 2: Template System
+    print("\n2. Testing Template System...")
+    try:
+        from features import PostTemplates
+        templates = PostTemplates()
+        all_templates = templates.get_all_templates()
+        print(f"   ✓ Found {len(all_templates)} default templates")
+
+        # List template names
+        template_names = [t['name'] for t in all_templates]
+        print(f"   Templates: {', '.join(template_names[:5])}...")
+
+        # Test template application
+        test_vars = {
+            'content': 'This is a test post!',
+            'author': 'Test User'
+        }
+        result = templates.apply_template('Quote', test_vars)
+        if result:
+            print(f"   ✓ Template application successful")
+            print(f"   Sample output: {result[:50]}...")
+
+    except Exception as e:
+        print(f"   ✗ Template error: {str(e)}")
+
+    # Test 3: Image Filters
+    print("\n3. Testing Image Filter System...")
+    try:
+        from utils import ImageFilters
+        filters = ImageFilters()
+        available_filters = filters.get_available_filters()
+        print(f"   ✓ Found {len(available_filters)} available filters")
+        print(f"   Filters: {', '.join(available_filters)}")
+    except Exception as e:
+        print(f"   ✗ Filter error: {str(e)}")
+
+    # Test 4: Image Utils
+    print("\n4. Testing Image Utilities...")
+    try:
+        import tempfile
+        from utils import ImageUtils
+        image_utils = ImageUtils()
+        print(f"   ✓ ImageUtils initialized")
+
+        # Test validation (with a non-existent file using portable path)
+        nonexistent_path = os.path.join(tempfile.gettempdir(), 'nonexistent.jpg')
+        is_valid, msg = image_utils.validate_image(nonexistent_path)
+        if not is_valid:
+            print(f"   ✓ Image validation works (correctly detected missing file)")
+
+    except Exception as e:
+        print(f"   ✗ Image utils error: {str(e)}")
+
+    # Test 5: Service Initialization
+    print("\n5. Testing Service Configuration...")
+    try:
+        # Check if services are configured
+        wp_configured = (
+            config.WORDPRESS_CONFIG.get('site_url') != 'https://yoursite.wordpress.com'
+        )
+        fb_configured = (
+            config.FACEBOOK_CONFIG.get('page_id') != 'your_page_id'
+        )
+        ig_configured = (
+            config.INSTAGRAM_CONFIG.get('business_account_id') != 'your_instagram_business_account_id'
+        )
+
+        print(f"   WordPress: {'✓ Configured' if wp_configured else '○ Not configured (template)'}")
+        print(f"   Facebook:  {'✓ Configured' if fb_configured else '○ Not configured (template)'}")
+        print(f"   Instagram: {'✓ Configured' if ig_configured else '○ Not configured (template)'}")
+
+        if not (wp_configured or fb_configured or ig_configured):
+            print("   ℹ  Create a .env file from .env.template and add your credentials for full functionality")
+
+    except Exception as e:
+        print(f"   ✗ Configuration error: {str(e)}")
+
+    # Test 6: App Settings
+    print("\n6. Testing App Settings...")
+    try:
+        print(f"   Max image size: {config.APP_SETTINGS['max_image_size_mb']} MB")
+        print(f"   Supported formats: {', '.join(config.APP_SETTINGS['supported_formats'])}")
+        print(f"   Max caption length: {config.APP_SETTINGS['max_caption_length']} chars")
+        print(f"   Concurrent uploads: {config.APP_SETTINGS['concurrent_uploads']}")
+        print("   ✓ App settings loaded successfully")
+    except Exception as e:
+        print(f"   ✗ Settings error: {str(e)}")
+
+    # Test 7: Essay Drafter
+    print("\n7. Testing Essay Drafter...")
+    try:
+        from features import EssayDrafter
+
+        # Check if Anthropic is configured
+        has_valid_api_key = (
+            config.ANTHROPIC_CONFIG.get('api_key') != config.PLACEHOLDER_ANTHROPIC_API_KEY
+        )
+
+        # Initialize essay drafter
+        drafter = EssayDrafter(
+            api_key=config.ANTHROPIC_CONFIG.get('api_key', ''),
+            model=config.ANTHROPIC_CONFIG.get('model', 'claude-3-5-sonnet-20241022')
+        )
+
+        print("   ✓ Essay Drafter initialized")
+
+        # Check for authorial voice files
+        voice_files = drafter.get_voice_file_names()
+        if voice_files:
+            print(f"   ✓ Found {len(voice_files)} authorial voice file(s):")
+            for vf in voice_files:
+                print(f"     - {vf}")
+        else:
+            print("   ○ No authorial voice files found (add .txt files to authorial_styles/)")
+
+        print(f"   Anthropic API: {'✓ Configured' if has_valid_api_key else '○ Not configured (template)'}")
+
+        if not has_valid_api_key:
+            print("   ℹ  Edit config.py to add your Anthropic API key for full functionality")
+
+    except Exception as e:
+        print(f"   ✗ Essay Drafter error: {str(e)}")
+    # Test 7: Unified Workflow Configuration
+    print("\n7. Testing Unified Workflow Configuration...")
+    try:
+        from config import (
+            UNIFIED_WORKFLOW_CONFIG, 
+            PLATFORM_REQUIREMENTS,
+            adjust_caption_for_platform,
+            adjust_image_for_platform
+        )
+
+        print(f"   Max retry attempts: {UNIFIED_WORKFLOW_CONFIG['max_retry_attempts']}")
+        print(f"   Retry delay: {UNIFIED_WORKFLOW_CONFIG['retry_delay']}s")
+        print(f"   Request timeout: {UNIFIED_WORKFLOW_CONFIG['timeout']}s")
+        print("   ✓ Unified workflow configuration loaded")
+
+        # Test platform requirements
+        print(f"\n   Platform Requirements:")
+        for platform, reqs in PLATFORM_REQUIREMENTS.items():
+            print(f"     • {platform.capitalize()}:")
+            print(f"       - Max caption: {reqs.get('max_caption_length', 'unlimited')}")
+            print(f"       - Max image size: {reqs.get('max_image_size', 'flexible')}")
+
+    except Exception as e:
+        print(f"   ✗ Unified workflow error: {str(e)}")
+
+    # Test 8: Caption Adjustment Function
+    print("\n8. Testing Caption Adjustment...")
+    try:
+        from config import adjust_caption_for_platform
+
+        # Test with a caption containing many hashtags
+        test_caption = "Amazing post! " + " ".join([f"#tag{i}" for i in range(40)])
+
+        # Test Instagram (max 30 hashtags)
+        ig_caption = adjust_caption_for_platform(test_caption, 'instagram')
+        ig_hashtags = [word for word in ig_caption.split() if word.startswith('#')]
+        print(f"   Instagram hashtag limit: {len(ig_hashtags)} <= 30")
+
+        if len(ig_hashtags) <= 30:
+            print("   ✓ Instagram caption adjustment works correctly")
+        else:
+            print(f"   ✗ Instagram caption has too many hashtags: {len(ig_hashtags)}")
+
+        # Test WordPress (no limits)
+        wp_caption = adjust_caption_for_platform(test_caption, 'wordpress')
+        print(f"   ✓ WordPress caption adjustment works")
+
+        # Test Facebook
+        fb_caption = adjust_caption_for_platform(test_caption, 'facebook')
+        print(f"   ✓ Facebook caption adjustment works")
+
+    except Exception as e:
+        print(f"   ✗ Caption adjustment error: {str(e)}")
+
+    # Test 9: Image Adjustment Function (Mock Test)
+    print("\n9. Testing Image Adjustment Function...")
+    try:
+        import tempfile
+        from config import adjust_image_for_platform
+
+        # We can't test with a real image without creating one,
+        # but we can verify the function exists and handles missing files
+        nonexistent_path = os.path.join(tempfile.gettempdir(), 'nonexistent.jpg')
+        result = adjust_image_for_platform(nonexistent_path, 'instagram')
+        print("   ✓ Image adjustment function is available")
+
+    except Exception as e:
+        print(f"   ✗ Image adjustment error: {str(e)}")
+
+    # Test 10: Environment Variable Support
+    print("\n10. Testing Environment Variable Support...")
+    try:
+        from dotenv import load_dotenv
+
+        # Check if .env file exists
+        env_file = os.path.join(os.path.dirname(__file__), '.env')
+        if os.path.exists(env_file):
+            print("   ✓ .env file found")
+            load_dotenv(env_file)
+            print("   ✓ Environment variables loaded from .env")
+        else:
+            print("   ○ No .env file (optional)")
+            print("   ℹ  Create .env from .env.example for environment-based configuration")
+
+        print("   ✓ python-dotenv module working correctly")
+
+    except Exception as e:
+        print(f"   ✗ Environment variable error: {str(e)}")
+
+    # Test 11: Unified Workflow Function (Without Actual Upload)
+    print("\n11. Testing Unified Workflow Function...")
+    try:
+        from config import unified_post_workflow, get_unified_workflow_summary
+
+        print("   ✓ unified_post_workflow function is available")
+        print("   ✓ get_unified_workflow_summary function is available")
+
+        # Test summary generation with mock results
+        mock_results = {
+            'WordPress': (True, 'https://example.com/post/123', []),
+            'Facebook': (False, 'Authentication failed', ['Attempt 1 failed: Invalid token', 'Attempt 2 failed: Invalid token']),
+            'Instagram': (True, 'Posted to Instagram: 12345', []),
+        }
+
+        summary = get_unified_workflow_summary(mock_results)
+        print("   ✓ Summary generation works")
+        print("\n   Sample Summary Output:")
+        print("   " + "\n   ".join(summary.split('\n')[:10]))
+
+    except Exception as e:
+        print(f"   ✗ Unified workflow function error: {str(e)}")
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+    print("All core functionality tests passed!")
+    print("\nNew Features Added:")
+    print("✓ Unified posting workflow with retry logic")
+    print("✓ Platform-specific caption adjustments")
+    print("✓ Platform-specific image size adjustments")
+    print("✓ Environment variable support (.env)")
+    print("✓ Enhanced error logging and reporting")
+    print("\nNext steps:")
+    print("1. Edit config.py with your platform credentials")
+    print("2. Add Anthropic API key for essay drafting feature")
+    print("3. Add authorial voice files to authorial_styles/ directory")
+    print("4. Install Tesseract OCR: sudo apt install tesseract-ocr (Linux)")
+    print("5. Run 'python main.py' to launch the app (requires Kivy)")
+    print("6. Or build for mobile with 'buildozer android debug'")
+    print("1. Create a .env file from .env.template and add your platform credentials")
+    print("2. Run 'python main.py' to launch the app (requires Kivy)")
+    print("3. Or build for mobile with 'buildozer android debug'")
+    print("4. See web/, ios/, and android/ directories for platform-specific starter templates")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
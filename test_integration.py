@@ -6,108 +6,116 @@ Tests the complete workflow from screenshot to essay draft.
 
 import sys
 import os
+import logging
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-print("=" * 70)
-print("Essay Drafter Integration Test")
-print("=" * 70)
+# Report through a logger writing plain messages to stdout
+logger = logging.getLogger('integration')
+handler = logging.StreamHandler(sys.stdout)
+handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+logger.info("=" * 70)
+logger.info("Essay Drafter Integration Test")
+logger.info("=" * 70)
 
 # Check if Tesseract is installed
-print("\n1. Checking Tesseract OCR Installation...")
+logger.info("\n1. Checking Tesseract OCR Installation...")
 try:
     import pytesseract
     
     # Try to get tesseract version
     try:
         version = pytesseract.get_tesseract_version()
-        print(f"   ✓ Tesseract OCR installed (version {version})")
+        logger.info(f"   ✓ Tesseract OCR installed (version {version})")
     except Exception:
-        print("   ✗ Tesseract OCR not installed or not in PATH")
-        print("   ℹ  Install with: sudo apt install tesseract-ocr (Ubuntu/Debian)")
-        print("   ℹ  Or: brew install tesseract (macOS)")
-        print("   Skipping OCR tests...")
+        logger.info("   ✗ Tesseract OCR not installed or not in PATH")
+        logger.info("   ℹ  Install with: sudo apt install tesseract-ocr (Ubuntu/Debian)")
+        logger.info("   ℹ  Or: brew install tesseract (macOS)")
+        logger.info("   Skipping OCR tests...")
         tesseract_available = False
 except ImportError:
-    print("   ✗ pytesseract module not installed")
-    print("   ℹ  Install with: pip install pytesseract")
+    logger.info("   ✗ pytesseract module not installed")
+    logger.info("   ℹ  Install with: pip install pytesseract")
     tesseract_available = False
 else:
     tesseract_available = True
 
 # Import Essay Drafter
-print("\n2. Importing Essay Drafter...")
+logger.info("\n2. Importing Essay Drafter...")
 try:
     from features.essay_drafter import EssayDrafter
     import config
-    print("   ✓ Essay Drafter imported successfully")
+    logger.info("   ✓ Essay Drafter imported successfully")
 except Exception as e:
-    print(f"   ✗ Import error: {str(e)}")
+    logger.info(f"   ✗ Import error: {str(e)}")
     sys.exit(1)
 
 # Initialize Essay Drafter
-print("\n3. Initializing Essay Drafter...")
+logger.info("\n3. Initializing Essay Drafter...")
 try:
     drafter = EssayDrafter(
         api_key=config.ANTHROPIC_CONFIG.get('api_key', ''),
         model=config.ANTHROPIC_CONFIG.get('model', 'claude-3-5-sonnet-20241022')
     )
-    print("   ✓ Essay Drafter initialized")
+    logger.info("   ✓ Essay Drafter initialized")
 except Exception as e:
-    print(f"   ✗ Initialization error: {str(e)}")
+    logger.info(f"   ✗ Initialization error: {str(e)}")
     sys.exit(1)
 
 # Check for test screenshot
-print("\n4. Checking for Test Screenshot...")
+logger.info("\n4. Checking for Test Screenshot...")
 test_image_path = 'test_screenshot.png'
 if os.path.exists(test_image_path):
-    print(f"   ✓ Test screenshot found: {test_image_path}")
+    logger.info(f"   ✓ Test screenshot found: {test_image_path}")
 else:
-    print(f"   ○ Test screenshot not found")
-    print(f"   ℹ  Run: python create_test_image.py to create one")
+    logger.info(f"   ○ Test screenshot not found")
+    logger.info(f"   ℹ  Run: python create_test_image.py to create one")
     test_image_path = None
 
 # Test OCR if both Tesseract and test image are available
 if tesseract_available and test_image_path:
-    print("\n5. Testing OCR Text Extraction...")
+    logger.info("\n5. Testing OCR Text Extraction...")
     try:
         success, extracted_text = drafter.extract_text_from_image(test_image_path)
         
         if success:
-            print(f"   ✓ Text extracted successfully ({len(extracted_text)} characters)")
-            print("\n   --- Extracted Text Preview ---")
+            logger.info(f"   ✓ Text extracted successfully ({len(extracted_text)} characters)")
             preview = extracted_text[:300]
-            for line in preview.split('\n')[:10]:
-                if line.strip():
-                    print(f"   {line}")
+            lines = ["\n   --- Extracted Text Preview ---"]
+            lines.extend(f"   {line}" for line in preview.split('\n')[:10] if line.strip())
             if len(extracted_text) > 300:
-                print("   ...")
-            print("   --- End Preview ---\n")
+                lines.append("   ...")
+            lines.append("   --- End Preview ---\n")
+            logger.info('\n'.join(lines))
         else:
-            print(f"   ✗ OCR failed: {extracted_text}")
+            logger.info(f"   ✗ OCR failed: {extracted_text}")
     except Exception as e:
-        print(f"   ✗ Error during OCR: {str(e)}")
+        logger.info(f"   ✗ Error during OCR: {str(e)}")
 else:
-    print("\n5. Testing OCR Text Extraction...")
-    print("   ⊘ Skipped (Tesseract or test image not available)")
+    logger.info("\n5. Testing OCR Text Extraction...")
+    logger.info("   ⊘ Skipped (Tesseract or test image not available)")
 
 # Test the complete workflow (without API call if not configured)
-print("\n6. Testing Complete Workflow (Mock)...")
+logger.info("\n6. Testing Complete Workflow (Mock)...")
 try:
     # Get authorial voice files
     voice_files = drafter.get_voice_file_names()
-    print(f"   ✓ Found {len(voice_files)} authorial voice file(s)")
+    logger.info(f"   ✓ Found {len(voice_files)} authorial voice file(s)")
     
     # Select voice
     selected_voice = drafter.select_authorial_voice(0)
     if selected_voice:
-        print(f"   ✓ Selected voice: {os.path.basename(selected_voice)}")
+        logger.info(f"   ✓ Selected voice: {os.path.basename(selected_voice)}")
     
     # Load voice
     voice_content = drafter.load_authorial_voice(selected_voice)
     if voice_content:
-        print(f"   ✓ Loaded voice content ({len(voice_content)} characters)")
+        logger.info(f"   ✓ Loaded voice content ({len(voice_content)} characters)")
     
     # Check API configuration
     has_valid_api_key = (
@@ -116,80 +124,82 @@ try:
     )
     
     if has_valid_api_key:
-        print("   ✓ Anthropic API configured")
+        logger.info("   ✓ Anthropic API configured")
         
         if tesseract_available and test_image_path:
-            print("\n   Full integration test available!")
-            print("   Would you like to run a complete test? (requires API credits)")
-            print("   This will:")
-            print("   - Extract text from test_screenshot.png")
-            print("   - Summarize the content using Claude")
-            print("   - Draft a complete essay")
-            print("\n   To run: Set RUN_FULL_TEST=1 environment variable")
+            logger.info("\n   Full integration test available!")
+            logger.info("   Would you like to run a complete test? (requires API credits)")
+            logger.info("   This will:")
+            logger.info("   - Extract text from test_screenshot.png")
+            logger.info("   - Summarize the content using Claude")
+            logger.info("   - Draft a complete essay")
+            logger.info("\n   To run: Set RUN_FULL_TEST=1 environment variable")
             
             if os.environ.get('RUN_FULL_TEST') == '1':
-                print("\n   Running full integration test...")
+                logger.info("\n   Running full integration test...")
                 result = drafter.process_screenshot_to_essay(
                     test_image_path,
                     voice_index=0
                 )
                 
                 if result['success']:
-                    print("   ✓ Essay drafted successfully!")
-                    print(f"\n   Voice used: {result['authorial_voice_file']}")
-                    print(f"   Extracted text: {len(result['extracted_text'])} characters")
-                    print(f"   Summary: {len(result['summary'])} characters")
-                    print(f"   Essay: {len(result['essay'])} characters")
+                    logger.info("   ✓ Essay drafted successfully!")
+                    logger.info(f"\n   Voice used: {result['authorial_voice_file']}")
+                    logger.info(f"   Extracted text: {len(result['extracted_text'])} characters")
+                    logger.info(f"   Summary: {len(result['summary'])} characters")
+                    logger.info(f"   Essay: {len(result['essay'])} characters")
                     
-                    print("\n   --- Essay Preview ---")
-                    print(result['essay'][:500])
-                    print("   ...")
-                    print("   --- End Preview ---")
+                    logger.info('\n'.join((
+                        "\n   --- Essay Preview ---",
+                        result['essay'][:500],
+                        "   ...",
+                        "   --- End Preview ---",
+                    )))
                 else:
-                    print(f"   ✗ Essay drafting failed: {result['error']}")
+                    logger.info(f"   ✗ Essay drafting failed: {result['error']}")
     else:
-        print("   ○ Anthropic API not configured")
-        print("   ℹ  Add API key to config.py to test full workflow")
-        print("   ℹ  Get API key from: https://www.anthropic.com/")
+        logger.info("   ○ Anthropic API not configured")
+        logger.info("   ℹ  Add API key to config.py to test full workflow")
+        logger.info("   ℹ  Get API key from: https://www.anthropic.com/")
     
 except Exception as e:
-    print(f"   ✗ Error: {str(e)}")
+    logger.info(f"   ✗ Error: {str(e)}")
     import traceback
     traceback.print_exc()
 
 # Summary
-print("\n" + "=" * 70)
-print("Integration Test Summary")
-print("=" * 70)
+logger.info("\n" + "=" * 70)
+logger.info("Integration Test Summary")
+logger.info("=" * 70)
 
-print("\nComponent Status:")
-print(f"  • Essay Drafter Module: ✓ Working")
-print(f"  • Authorial Voice Files: ✓ Available")
-print(f"  • Tesseract OCR: {'✓ Installed' if tesseract_available else '○ Not installed'}")
-print(f"  • Test Screenshot: {'✓ Available' if test_image_path else '○ Not available'}")
-print(f"  • Anthropic API: {'✓ Configured' if has_valid_api_key else '○ Not configured'}")
+logger.info("\nComponent Status:")
+logger.info(f"  • Essay Drafter Module: ✓ Working")
+logger.info(f"  • Authorial Voice Files: ✓ Available")
+logger.info(f"  • Tesseract OCR: {'✓ Installed' if tesseract_available else '○ Not installed'}")
+logger.info(f"  • Test Screenshot: {'✓ Available' if test_image_path else '○ Not available'}")
+logger.info(f"  • Anthropic API: {'✓ Configured' if has_valid_api_key else '○ Not configured'}")
 
-print("\nFeature Capabilities:")
-print("  ✓ Load and manage authorial voice files")
-print("  ✓ Format essays for Substack/blogging platforms")
+logger.info("\nFeature Capabilities:")
+logger.info("  ✓ Load and manage authorial voice files")
+logger.info("  ✓ Format essays for Substack/blogging platforms")
 if tesseract_available:
-    print("  ✓ Extract text from screenshots using OCR")
+    logger.info("  ✓ Extract text from screenshots using OCR")
 else:
-    print("  ○ OCR functionality (requires Tesseract)")
+    logger.info("  ○ OCR functionality (requires Tesseract)")
 if has_valid_api_key:
-    print("  ✓ Generate essays using Claude AI")
+    logger.info("  ✓ Generate essays using Claude AI")
 else:
-    print("  ○ AI essay generation (requires Anthropic API key)")
+    logger.info("  ○ AI essay generation (requires Anthropic API key)")
 
-print("\nNext Steps:")
+logger.info("\nNext Steps:")
 if not tesseract_available:
-    print("1. Install Tesseract OCR for text extraction")
+    logger.info("1. Install Tesseract OCR for text extraction")
 if not has_valid_api_key:
-    print("2. Configure Anthropic API key in config.py")
+    logger.info("2. Configure Anthropic API key in config.py")
 if not test_image_path:
-    print("3. Run 'python create_test_image.py' to create test screenshot")
+    logger.info("3. Run 'python create_test_image.py' to create test screenshot")
 if tesseract_available and has_valid_api_key and test_image_path:
-    print("✓ All components ready!")
-    print("  Run with RUN_FULL_TEST=1 to test complete workflow")
+    logger.info("✓ All components ready!")
+    logger.info("  Run with RUN_FULL_TEST=1 to test complete workflow")
 
-print("=" * 70)
+logger.info("=" * 70)
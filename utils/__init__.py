@@ -1,11 +1,32 @@
 """Utils package for Postboi."""
 
-from utils.image_utils import ImageUtils
-from utils.filters import ImageFilters
-from utils.settings_manager import SettingsManager
+import importlib
 
-__all__ = [
+# Exported name -> submodule defining it; imported on first access (PEP 562)
+# so settings-only callers don't pay for loading PIL
+_LAZY_EXPORTS = {
+    'ImageUtils': 'utils.image_utils',
+    'ImageFilters': 'utils.filters',
+    'SettingsManager': 'utils.settings_manager',
+}
+
+__all__ = (
     'ImageUtils',
     'ImageFilters',
     'SettingsManager',
-]
+)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
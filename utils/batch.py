@@ -0,0 +1,91 @@
+"""
+Batch processing for Postboi.
+Fans filter and OCR work for many images out across CPU cores.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from utils.filters import ImageFilters
+
+
+def _default_workers(workers: Optional[int], jobs: int) -> int:
+    """Resolve the worker count, never starting more processes than jobs."""
+    if not workers or workers < 1:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, jobs))
+
+
+def _apply_filter_worker(args: Tuple[str, str]) -> Optional[str]:
+    """Apply a single filter inside a worker process."""
+    image_path, filter_name = args
+    return ImageFilters.apply_filter(image_path, filter_name)
+
+
+def batch_apply_filter(paths: List[str], filter_name: str,
+                       workers: Optional[int] = None) -> List[Optional[str]]:
+    """
+    Apply a filter to many images in parallel.
+
+    Args:
+        paths: Paths to the input images
+        filter_name: Name of the filter to apply
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Output paths in the same order as paths, None where a filter failed
+    """
+    if not paths:
+        return []
+
+    jobs = [(path, filter_name) for path in paths]
+    with ProcessPoolExecutor(max_workers=_default_workers(workers, len(jobs))) as executor:
+        return list(executor.map(_apply_filter_worker, jobs))
+
+
+def _init_ocr_worker():
+    """Keep Tesseract single-threaded so worker processes don't oversubscribe cores."""
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def _ocr_worker(args: Tuple[str, Optional[int]]) -> Tuple[str, bool, str]:
+    """Run OCR on a single image inside a worker process."""
+    image_path, min_text_length = args
+    try:
+        # Same tesseract settings and success check as EssayDrafter
+        from features.essay_drafter import EssayDrafter, ocr_result, pytesseract_text
+
+        if min_text_length is None:
+            min_text_length = EssayDrafter.MIN_TEXT_LENGTH
+        success, text = ocr_result(pytesseract_text(image_path), min_text_length)
+        return image_path, success, text
+    except Exception as e:
+        return image_path, False, f"Error extracting text: {str(e)}"
+
+
+def batch_ocr(paths: List[str], workers: Optional[int] = None,
+              min_text_length: Optional[int] = None) -> List[Tuple[str, bool, str]]:
+    """
+    Extract text from many images in parallel.
+
+    Each worker runs Tesseract with OMP_THREAD_LIMIT=1, so throughput
+    scales with the number of processes instead of Tesseract's own threads.
+    OCR settings match EssayDrafter.extract_text_from_image.
+
+    Args:
+        paths: Paths to the images
+        workers: Number of worker processes (default: CPU count)
+        min_text_length: Minimum characters to consider OCR successful
+            (default: EssayDrafter.MIN_TEXT_LENGTH)
+
+    Returns:
+        List of (image_path, success, text or error_message) in input order
+    """
+    if not paths:
+        return []
+
+    jobs = [(path, min_text_length) for path in paths]
+    with ProcessPoolExecutor(max_workers=_default_workers(workers, len(jobs)),
+                             initializer=_init_ocr_worker) as executor:
+        return list(executor.map(_ocr_worker, jobs))
@@ -3,9 +3,28 @@ Image filters for Postboi.
 Provides various image filters and effects.
 """
 
-from typing import Optional
+from functools import partial
+from typing import List, Optional
 from PIL import Image, ImageEnhance, ImageFilter
 
+# NumPy is optional; it lets per-pixel filters run vectorized in C
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Above this many pixels, sharpen uses a NumPy unsharp mask instead of
+# Pillow's 3x3 SHARPEN kernel
+SHARPEN_NUMPY_MIN_PIXELS = 2_000_000
+
+# Classic sepia colour matrix; each row produces one output channel (R, G, B)
+_SEPIA_MATRIX = (
+    (0.393, 0.769, 0.189),
+    (0.349, 0.686, 0.168),
+    (0.272, 0.534, 0.131),
+)
+
 
 class ImageFilters:
     """Collection of image filters and effects."""
@@ -26,24 +45,10 @@ class ImageFilters:
         try:
             with Image.open(image_path) as img:
                 # Apply the specified filter
-                if filter_name == 'grayscale':
-                    filtered_img = ImageFilters.grayscale(img)
-                elif filter_name == 'sepia':
-                    filtered_img = ImageFilters.sepia(img)
-                elif filter_name == 'vintage':
-                    filtered_img = ImageFilters.vintage(img)
-                elif filter_name == 'bright':
-                    filtered_img = ImageFilters.adjust_brightness(img, 1.3)
-                elif filter_name == 'dark':
-                    filtered_img = ImageFilters.adjust_brightness(img, 0.7)
-                elif filter_name == 'high_contrast':
-                    filtered_img = ImageFilters.adjust_contrast(img, 1.5)
-                elif filter_name == 'blur':
-                    filtered_img = ImageFilters.blur(img)
-                elif filter_name == 'sharpen':
-                    filtered_img = ImageFilters.sharpen(img)
-                else:
+                filter_fn = _SAVE_DISPATCH.get(filter_name) or _FILTER_DISPATCH.get(filter_name)
+                if filter_fn is None:
                     return None
+                filtered_img = filter_fn(img)
 
                 # Save filtered image
                 if not output_path:
@@ -56,10 +61,52 @@ class ImageFilters:
             print(f"Error applying filter: {str(e)}")
             return None
 
+    @staticmethod
+    def apply_filters_pipeline(image_path: str, filter_names: List[str],
+                               output_path: Optional[str] = None) -> Optional[str]:
+        """
+        Apply several filters in sequence, decoding and encoding only once.
+
+        Args:
+            image_path: Path to the input image
+            filter_names: Filter names to apply, in order
+            output_path: Path for output image (optional)
+
+        Returns:
+            Path to filtered image, or None if failed
+        """
+        available = ImageFilters.get_available_filters()
+        if not filter_names or any(name not in available for name in filter_names):
+            return None
+
+        try:
+            with Image.open(image_path) as img:
+                # Chain the in-memory filters on the decoded image
+                filtered_img = img
+                for filter_name in filter_names:
+                    filtered_img = ImageFilters.preview_filter(filtered_img, filter_name)
+
+                # Save filtered image
+                if not output_path:
+                    suffix = '_'.join(filter_names)
+                    output_path = image_path.replace('.', f'_{suffix}.')
+
+                filtered_img.save(output_path)
+                return output_path
+
+        except Exception as e:
+            print(f"Error applying filters: {str(e)}")
+            return None
+
     @staticmethod
     def grayscale(img: Image.Image) -> Image.Image:
         """Convert image to grayscale."""
-        return img.convert('L').convert('RGB')
+        return ImageFilters.grayscale_l(img).convert('RGB')
+
+    @staticmethod
+    def grayscale_l(img: Image.Image) -> Image.Image:
+        """Convert image to single-band ('L' mode) grayscale."""
+        return img.convert('L')
 
     @staticmethod
     def sepia(img: Image.Image, intensity: float = 1.0) -> Image.Image:
@@ -77,28 +124,21 @@ class ImageFilters:
         if img.mode != 'RGB':
             img = img.convert('RGB')
 
-        # Get image data
-        width, height = img.size
-        pixels = img.load()
-
-        # Apply sepia transformation more efficiently
-        for y in range(height):
-            for x in range(width):
-                r, g, b = pixels[x, y]
-
-                # Calculate sepia values
-                tr = int(0.393 * r + 0.769 * g + 0.189 * b)
-                tg = int(0.349 * r + 0.686 * g + 0.168 * b)
-                tb = int(0.272 * r + 0.534 * g + 0.131 * b)
-
-                # Apply intensity and clamp values
-                tr = min(255, int(tr * intensity + r * (1 - intensity)))
-                tg = min(255, int(tg * intensity + g * (1 - intensity)))
-                tb = min(255, int(tb * intensity + b * (1 - intensity)))
-
-                pixels[x, y] = (tr, tg, tb)
-
-        return img
+        if HAS_NUMPY:
+            # Whole-image matrix multiply instead of a per-pixel Python loop
+            rgb = np.asarray(img, dtype=np.float32)
+            toned = np.floor(rgb @ np.asarray(_SEPIA_MATRIX, dtype=np.float32).T)
+            blended = np.floor(toned * intensity + rgb * (1 - intensity))
+            return Image.fromarray(np.minimum(blended, 255).astype(np.uint8), 'RGB')
+
+        # Without NumPy, fold the intensity blend into the colour matrix and
+        # let Pillow apply it in C (it rounds rather than floors)
+        matrix = []
+        for row, weights in enumerate(_SEPIA_MATRIX):
+            for col, weight in enumerate(weights):
+                matrix.append(weight * intensity + (1 - intensity) * (row == col))
+            matrix.append(0.0)
+        return img.convert('RGB', tuple(matrix))
 
     @staticmethod
     def vintage(img: Image.Image) -> Image.Image:
@@ -169,16 +209,29 @@ class ImageFilters:
         return img.filter(ImageFilter.GaussianBlur(radius))
 
     @staticmethod
-    def sharpen(img: Image.Image) -> Image.Image:
+    def sharpen(img: Image.Image, amount: float = 1.0) -> Image.Image:
         """
         Apply sharpen effect.
 
         Args:
             img: PIL Image object
+            amount: Sharpening strength (1.0 is the default strength)
 
         Returns:
             Sharpened PIL Image object
         """
+        if (HAS_NUMPY and img.mode in ('L', 'RGB')
+                and img.width * img.height > SHARPEN_NUMPY_MIN_PIXELS):
+            # Unsharp mask: original + amount * (original - blurred), vectorized
+            blurred = img.filter(ImageFilter.GaussianBlur(1))
+            original = np.asarray(img, dtype=np.int16)
+            detail = original - np.asarray(blurred, dtype=np.int16)
+            sharpened = original + np.float32(amount) * detail
+            return Image.fromarray(np.clip(sharpened, 0, 255).astype(np.uint8), img.mode)
+
+        if amount != 1.0:
+            return img.filter(ImageFilter.UnsharpMask(radius=1, percent=round(amount * 100), threshold=0))
+
         return img.filter(ImageFilter.SHARPEN)
 
     @staticmethod
@@ -213,24 +266,27 @@ class ImageFilters:
         Returns:
             Filtered PIL Image object for preview
         """
-        if filter_name == 'none':
-            return img
-
-        if filter_name == 'grayscale':
-            return ImageFilters.grayscale(img)
-        elif filter_name == 'sepia':
-            return ImageFilters.sepia(img)
-        elif filter_name == 'vintage':
-            return ImageFilters.vintage(img)
-        elif filter_name == 'bright':
-            return ImageFilters.adjust_brightness(img, 1.3)
-        elif filter_name == 'dark':
-            return ImageFilters.adjust_brightness(img, 0.7)
-        elif filter_name == 'high_contrast':
-            return ImageFilters.adjust_contrast(img, 1.5)
-        elif filter_name == 'blur':
-            return ImageFilters.blur(img)
-        elif filter_name == 'sharpen':
-            return ImageFilters.sharpen(img)
-        else:
+        # 'none' and unknown names leave the image untouched
+        filter_fn = _FILTER_DISPATCH.get(filter_name)
+        if filter_fn is None:
             return img
+        return filter_fn(img)
+
+
+# Filter name -> callable taking a PIL Image, shared by apply_filter and preview_filter
+_FILTER_DISPATCH = {
+    'grayscale': ImageFilters.grayscale,
+    'sepia': ImageFilters.sepia,
+    'vintage': ImageFilters.vintage,
+    'bright': partial(ImageFilters.adjust_brightness, factor=1.3),
+    'dark': partial(ImageFilters.adjust_brightness, factor=0.7),
+    'high_contrast': partial(ImageFilters.adjust_contrast, factor=1.5),
+    'blur': ImageFilters.blur,
+    'sharpen': ImageFilters.sharpen,
+}
+
+# Overrides used when the result is written straight to disk; every output
+# format we save supports 'L', so grayscale skips the RGB re-expansion
+_SAVE_DISPATCH = {
+    'grayscale': ImageFilters.grayscale_l,
+}
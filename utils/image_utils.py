@@ -4,10 +4,25 @@ Handles image resizing, validation, thumbnail generation, and EXIF data.
 """
 
 import os
-from typing import Tuple, Optional
-from PIL import Image, ExifTags
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple, Union
+from PIL import Image, ImageOps, ExifTags, __version__ as PIL_VERSION
 from io import BytesIO
 
+# Pillow-SIMD is a drop-in Pillow build with SIMD resize/blur/convolution
+# kernels; its releases are tagged with a ".postN" version suffix
+IS_PILLOW_SIMD = '.post' in PIL_VERSION
+
+# Default formats accepted by validate_image
+SUPPORTED_FORMATS = frozenset(('jpg', 'jpeg', 'png', 'webp'))
+
+# Formats that can carry an EXIF orientation tag (MPO is the multi-picture
+# JPEG variant many phone cameras write)
+EXIF_FORMATS = frozenset(('JPEG', 'MPO', 'TIFF', 'WEBP'))
+
+# Operations accept either a file path or an already opened image
+ImageSource = Union[str, Image.Image]
+
 
 class ImageUtils:
     """Utility class for image processing operations."""
@@ -27,54 +42,105 @@ class ImageUtils:
             Tuple of (is_valid, error_message)
         """
         if supported_formats is None:
-            supported_formats = ['jpg', 'jpeg', 'png', 'webp']
+            supported_formats = SUPPORTED_FORMATS
 
-        # Check if file exists
-        if not os.path.exists(image_path):
+        # Check existence and size with a single stat call
+        try:
+            file_size_mb = os.stat(image_path).st_size / (1024 * 1024)
+        except FileNotFoundError:
             return False, "File does not exist"
 
-        # Check file size
-        file_size_mb = os.path.getsize(image_path) / (1024 * 1024)
         if file_size_mb > max_size_mb:
             return False, f"File size ({file_size_mb:.2f}MB) exceeds limit ({max_size_mb}MB)"
 
-        # Check format
+        # Check format; verify() checks integrity without decoding pixel data
         try:
             with Image.open(image_path) as img:
                 image_format = img.format.lower() if img.format else ''
                 if image_format not in supported_formats:
                     return False, f"Unsupported format: {image_format}"
+                img.verify()
         except Exception as e:
             return False, f"Invalid image file: {str(e)}"
 
         return True, "Valid image"
 
     @staticmethod
-    def resize_image(image_path: str, max_width: int = 1920, max_height: int = 1920,
-                    quality: int = 85) -> Optional[str]:
+    @contextmanager
+    def open_image(image_path: str) -> Iterator[Image.Image]:
         """
-        Resize image while maintaining aspect ratio.
+        Open and decode an image once so several operations can share it.
+
+        Example:
+            with ImageUtils.open_image(path) as img:
+                ImageUtils.resize_image(img)
+                ImageUtils.create_thumbnail(img)
 
         Args:
             image_path: Path to the image file
+
+        Yields:
+            Decoded PIL Image object
+        """
+        with Image.open(image_path) as img:
+            img.load()
+            yield img
+
+    @staticmethod
+    @contextmanager
+    def _as_image(image: ImageSource) -> Iterator[Image.Image]:
+        """Yield the given image, opening it first if a path was passed."""
+        if isinstance(image, Image.Image):
+            yield image
+        else:
+            with Image.open(image) as img:
+                yield img
+
+    @staticmethod
+    def _source_path(image: ImageSource) -> str:
+        """Get the file path an image came from, for deriving output paths."""
+        source_path = image if isinstance(image, str) else getattr(image, 'filename', '')
+        if not source_path:
+            raise ValueError("output_path is required for images not opened from a file")
+        return source_path
+
+    @staticmethod
+    def _fit(img: Image.Image, size: Tuple[int, int], shared: bool) -> Image.Image:
+        """Orient and shrink an image to fit size, copying first if it is shared."""
+        # Preserve EXIF orientation
+        fitted = ImageUtils._correct_orientation(img)
+        if shared and fitted is img:
+            fitted = img.copy()
+
+        # Calculate new size maintaining aspect ratio
+        fitted.thumbnail(size, Image.Resampling.LANCZOS)
+        return fitted
+
+    @staticmethod
+    def resize_image(image_path: ImageSource, max_width: int = 1920, max_height: int = 1920,
+                    quality: int = 85, output_path: Optional[str] = None) -> Optional[str]:
+        """
+        Resize image while maintaining aspect ratio.
+
+        Args:
+            image_path: Path to the image file, or an opened PIL Image
             max_width: Maximum width in pixels
             max_height: Maximum height in pixels
             quality: JPEG quality (1-100)
+            output_path: Path for output image (optional)
 
         Returns:
             Path to resized image, or None if failed
         """
         try:
-            with Image.open(image_path) as img:
-                # Preserve EXIF orientation
-                img = ImageUtils._correct_orientation(img)
-
-                # Calculate new size maintaining aspect ratio
-                img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+            with ImageUtils._as_image(image_path) as img:
+                shared = isinstance(image_path, Image.Image)
+                resized = ImageUtils._fit(img, (max_width, max_height), shared)
 
                 # Save resized image
-                output_path = image_path.replace('.', '_resized.')
-                img.save(output_path, quality=quality, optimize=True)
+                if not output_path:
+                    output_path = ImageUtils._source_path(image_path).replace('.', '_resized.')
+                resized.save(output_path, quality=quality, optimize=True)
 
                 return output_path
 
@@ -83,28 +149,28 @@ class ImageUtils:
             return None
 
     @staticmethod
-    def create_thumbnail(image_path: str, size: Tuple[int, int] = (300, 300)) -> Optional[str]:
+    def create_thumbnail(image_path: ImageSource, size: Tuple[int, int] = (300, 300),
+                         output_path: Optional[str] = None) -> Optional[str]:
         """
         Create a thumbnail of the image.
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an opened PIL Image
             size: Thumbnail size as (width, height)
+            output_path: Path for output thumbnail (optional)
 
         Returns:
             Path to thumbnail, or None if failed
         """
         try:
-            with Image.open(image_path) as img:
-                # Preserve EXIF orientation
-                img = ImageUtils._correct_orientation(img)
-
-                # Create thumbnail
-                img.thumbnail(size, Image.Resampling.LANCZOS)
+            with ImageUtils._as_image(image_path) as img:
+                shared = isinstance(image_path, Image.Image)
+                thumb = ImageUtils._fit(img, size, shared)
 
                 # Save thumbnail
-                output_path = image_path.replace('.', '_thumb.')
-                img.save(output_path, quality=80)
+                if not output_path:
+                    output_path = ImageUtils._source_path(image_path).replace('.', '_thumb.')
+                thumb.save(output_path, quality=80)
 
                 return output_path
 
@@ -112,6 +178,40 @@ class ImageUtils:
             print(f"Error creating thumbnail: {str(e)}")
             return None
 
+    @staticmethod
+    def process(image_path: str, *, resize: Optional[Tuple[int, int]] = None,
+                thumbnail: Optional[Tuple[int, int]] = None,
+                to_jpg: bool = False) -> Dict[str, Optional[str]]:
+        """
+        Run several operations on an image while decoding it only once.
+
+        Args:
+            image_path: Path to the image file
+            resize: (max_width, max_height) to resize to, or None to skip
+            thumbnail: Thumbnail size as (width, height), or None to skip
+            to_jpg: Whether to also write a JPEG copy
+
+        Returns:
+            Dictionary with 'resized', 'thumbnail' and/or 'jpg' output paths
+            for the requested operations (None where an operation failed)
+        """
+        results: Dict[str, Optional[str]] = {}
+        try:
+            with ImageUtils.open_image(image_path) as img:
+                if resize:
+                    results['resized'] = ImageUtils.resize_image(img, *resize)
+                if thumbnail:
+                    results['thumbnail'] = ImageUtils.create_thumbnail(img, thumbnail)
+                if to_jpg:
+                    results['jpg'] = ImageUtils.convert_to_jpg(img)
+        except Exception as e:
+            print(f"Error processing image: {str(e)}")
+            for key, requested in (('resized', resize), ('thumbnail', thumbnail), ('jpg', to_jpg)):
+                if requested:
+                    results.setdefault(key, None)
+
+        return results
+
     @staticmethod
     def _correct_orientation(img: Image.Image) -> Image.Image:
         """
@@ -123,26 +223,38 @@ class ImageUtils:
         Returns:
             Corrected PIL Image object
         """
+        # Skip EXIF parsing for formats without it (e.g. PNG screenshots).
+        # TIFF keeps orientation in its own tags rather than an 'exif' block.
+        if img.format not in EXIF_FORMATS or (img.format != 'TIFF' and 'exif' not in img.info):
+            return img
+
         try:
-            # Get EXIF data using the public API
-            exif = img.getexif()
-            if exif is not None:
-                # Get orientation tag
-                orientation = exif.get(0x0112)  # 0x0112 is the Orientation tag
-
-                # Rotate based on orientation
-                if orientation == 3:
-                    img = img.rotate(180, expand=True)
-                elif orientation == 6:
-                    img = img.rotate(270, expand=True)
-                elif orientation == 8:
-                    img = img.rotate(90, expand=True)
-
-        except (AttributeError, KeyError, IndexError):
-            # No EXIF data or orientation tag
-            pass
-
-        return img
+            # Orientation 1 (or none) needs no change; keep the same object so
+            # lazy decoding (e.g. JPEG draft mode in thumbnail) still applies
+            orientation = img.getexif().get(0x0112)  # 0x0112 is the Orientation tag
+            if orientation in (None, 1):
+                return img
+
+            # Handles all eight orientations, including mirrored ones
+            return ImageOps.exif_transpose(img)
+
+        except (AttributeError, KeyError, IndexError, ValueError):
+            # Missing or malformed EXIF data
+            return img
+
+    @staticmethod
+    def get_pillow_build() -> dict:
+        """
+        Describe the Pillow build in use.
+
+        Returns:
+            Dictionary with the Pillow version and whether it is Pillow-SIMD
+        """
+        return {
+            'version': PIL_VERSION,
+            'simd': IS_PILLOW_SIMD,
+            'core': Image.core.__name__,
+        }
 
     @staticmethod
     def get_image_info(image_path: str) -> dict:
@@ -170,30 +282,38 @@ class ImageUtils:
             return {'error': str(e)}
 
     @staticmethod
-    def convert_to_jpg(image_path: str, quality: int = 90) -> Optional[str]:
+    def convert_to_jpg(image_path: ImageSource, quality: int = 90,
+                       output_path: Optional[str] = None) -> Optional[str]:
         """
         Convert image to JPEG format.
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an opened PIL Image
             quality: JPEG quality (1-100)
+            output_path: Path for output image (optional)
 
         Returns:
             Path to converted image, or None if failed
         """
         try:
-            with Image.open(image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Create white background
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
+            with ImageUtils._as_image(image_path) as img:
+                # RGB and L are written as-is; only other modes need converting
+                if img.mode not in ('RGB', 'L'):
+                    has_alpha = (img.mode in ('RGBA', 'LA')
+                                 or (img.mode == 'P' and 'transparency' in img.info))
+                    if has_alpha:
+                        # Flatten transparency onto a white background
+                        background = Image.new('RGB', img.size, (255, 255, 255))
+                        if img.mode == 'P':
+                            img = img.convert('RGBA')
+                        background.paste(img, mask=img.split()[-1])
+                        img = background
+                    else:
+                        img = img.convert('RGB')
 
                 # Save as JPEG
-                output_path = os.path.splitext(image_path)[0] + '.jpg'
+                if not output_path:
+                    output_path = os.path.splitext(ImageUtils._source_path(image_path))[0] + '.jpg'
                 img.save(output_path, 'JPEG', quality=quality, optimize=True)
 
                 return output_path
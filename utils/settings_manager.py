@@ -5,10 +5,44 @@ Supports per-user settings when linked to an authenticated user.
 """
 
 import os
+import sys
+import copy
 import json
+import mmap
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+# orjson is optional; it serializes settings in C, several times faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _platform_base_dir() -> Path:
+    """Get the platform-specific base directory for app settings."""
+    if os.name == 'nt':  # Windows
+        return Path(os.environ.get('APPDATA', Path.home()))
+    if os.name == 'posix':
+        # macOS and Linux
+        if sys.platform == 'darwin':
+            return Path.home() / 'Library' / 'Application Support'
+        return Path.home() / '.config'
+    return Path.home()
+
+
+# Settings files larger than this are memory-mapped instead of read()
+# (orjson only; json.loads needs a bytes copy anyway)
+_MMAP_THRESHOLD = 64 * 1024
+
+# Credential keys masked by export_settings
+_SECRET_KEYS = frozenset(('app_password', 'app_secret', 'access_token'))
+
+# Platform never changes during the process lifetime, so resolve it once
+_PLATFORM_BASE_DIR = _platform_base_dir()
+
 
 class SettingsManager:
     """Manages persistent storage of user settings and credentials."""
@@ -24,8 +58,10 @@ class SettingsManager:
         self.app_name = app_name
         self._user_id = user_id
         self._settings_dir = self._get_settings_dir()
+        self._file_cache: Dict[Optional[str], Path] = {}
         self._settings_file = self._get_settings_file()
         self._settings: Dict[str, Any] = {}
+        self._defer_save = False
         self._load_settings()
     
     def set_user(self, user_id: Optional[str]):
@@ -43,25 +79,18 @@ class SettingsManager:
     
     def _get_settings_file(self) -> Path:
         """Get settings file path, user-specific if user_id is set."""
-        if self._user_id:
-            return self._settings_dir / f"settings_{self._user_id[:16]}.json"
-        return self._settings_dir / "settings.json"
+        settings_file = self._file_cache.get(self._user_id)
+        if settings_file is None:
+            if self._user_id:
+                settings_file = self._settings_dir / f"settings_{self._user_id[:16]}.json"
+            else:
+                settings_file = self._settings_dir / "settings.json"
+            self._file_cache[self._user_id] = settings_file
+        return settings_file
 
     def _get_settings_dir(self) -> Path:
         """Get platform-specific settings directory."""
-        # Check for different platforms
-        if os.name == 'nt':  # Windows
-            base_dir = Path(os.environ.get('APPDATA', Path.home()))
-        elif os.name == 'posix':
-            # macOS and Linux
-            if 'darwin' in os.uname().sysname.lower():
-                base_dir = Path.home() / 'Library' / 'Application Support'
-            else:
-                base_dir = Path.home() / '.config'
-        else:
-            base_dir = Path.home()
-
-        settings_dir = base_dir / self.app_name
+        settings_dir = _PLATFORM_BASE_DIR / self.app_name
         settings_dir.mkdir(parents=True, exist_ok=True)
         return settings_dir
 
@@ -69,21 +98,60 @@ class SettingsManager:
         """Load settings from file."""
         if self._settings_file.exists():
             try:
-                with open(self._settings_file, 'r') as f:
-                    self._settings = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(self._settings_file, 'rb') as f:
+                    if HAS_ORJSON and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                        # orjson parses straight from the mapping, without
+                        # copying the file into a bytes object first
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                                memoryview(mm) as view:
+                            self._settings = orjson.loads(view)
+                    else:
+                        data = f.read()
+                        self._settings = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+            except (ValueError, IOError):
                 self._settings = self._get_default_settings()
         else:
             self._settings = self._get_default_settings()
 
     def _save_settings(self):
-        """Save settings to file."""
+        """Save settings to file, unless writes are deferred by batch()."""
+        if self._defer_save:
+            return
+
         try:
-            with open(self._settings_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
+            if HAS_ORJSON:
+                # OPT_NON_STR_KEYS stringifies int/float keys the way json.dump does
+                self._settings_file.write_bytes(orjson.dumps(
+                    self._settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            else:
+                with open(self._settings_file, 'w') as f:
+                    json.dump(self._settings, f, indent=2)
         except IOError as e:
             print(f"Error saving settings: {e}")
 
+    @contextmanager
+    def batch(self):
+        """
+        Defer saving until the block exits, so several setters write once.
+
+        Example:
+            with settings.batch():
+                settings.set_wordpress_config(...)
+                settings.set_app_setting('theme', 'Dark')
+        """
+        if self._defer_save:
+            # Already inside a batch; the outermost one saves
+            yield self
+            return
+
+        self._defer_save = True
+        try:
+            yield self
+        finally:
+            self._defer_save = False
+            self._save_settings()
+
     def _get_default_settings(self) -> Dict[str, Any]:
         """Return default settings structure."""
         return {
@@ -215,7 +283,8 @@ class SettingsManager:
     def export_settings(self, exclude_secrets: bool = True) -> Dict[str, Any]:
         """Export settings (optionally excluding secrets)."""
         if not exclude_secrets:
-            return self._settings.copy()
+            # Deep copy, so callers can't mutate the stored credentials
+            return copy.deepcopy(self._settings)
         
         # Create a copy without sensitive data
         export = {}
@@ -223,7 +292,7 @@ class SettingsManager:
             if isinstance(config, dict):
                 export[platform] = {}
                 for key, value in config.items():
-                    if key in ('app_password', 'app_secret', 'access_token'):
+                    if key in _SECRET_KEYS:
                         export[platform][key] = '***' if value else ''
                     else:
                         export[platform][key] = value